@@ -6,6 +6,7 @@ This module contains helper functions for importing race data from BikeReg.com.
 """
 
 import csv
+from operator import itemgetter
 import common
 
 __copyright__ = '''
@@ -32,27 +33,35 @@ __maintainer__ = common.MAINTAINER
 __email__ = common.EMAIL
 __status__ = common.STATUS
 
+# BikeReg csv export columns, picked out and ordered the way add_racers() wants them: bib,
+# first name, last name, field, category, team, age.
+RACER_COLUMNS = itemgetter(1, 4, 6, 2, 9, 8, 0)
+FIELD_COLUMN = 2
+
+ONE_DAY_LICENSE = 'One-day License'
+
 def import_csv(modeldb, filename):
     """Import a BikeReg csv racers list export file.
 
     Open BikeReg csv export file and populate the field and racer lists.
     """
-    racer_table_model = modeldb.racer_table_model
+    racer_list = []
 
-    with open(filename) as import_file:
+    with open(filename, newline='') as import_file:
         reader = csv.reader(import_file)
 
         # Skip the heading row.
         next(reader)
 
         for row in reader:
-            age, bib, field, _, first_name, _, last_name, _, team, category, *_ = row
-
             # BikeReg lists One-day License holders twice, and the second
             # listing is missing the bib#, and instead has:
             # "License - 1/1/2018 - One-day License" as the field. Skip over
-            # these entries.
-            if 'One-day License' in field:
+            # these entries, before bothering to pick the row apart.
+            if ONE_DAY_LICENSE in row[FIELD_COLUMN]:
                 continue
 
-            racer_table_model.add_racer(bib, first_name, last_name, field, category, team, age)
+            racer_list.append(RACER_COLUMNS(row))
+
+    # Insert everything in one go, rather than committing each racer separately.
+    modeldb.racer_table_model.add_racers(racer_list)
@@ -7,25 +7,21 @@ central widget, status and menu bars, etc.
 """
 
 import os
-from PyQt5.QtCore import QDateTime, QItemSelection, QObject, QRegExp, QSettings, Qt
+from PyQt5.QtCore import QDateTime, QObject, QRegExp, QSettings, Qt, QTimer
 from PyQt5.QtGui import QKeySequence, QPixmap, QRegExpValidator
 from PyQt5.QtWidgets import QLabel, QLineEdit, QMenuBar, QPushButton, QShortcut, QStatusBar, QWidget
 from PyQt5.QtWidgets import QLayout, QHBoxLayout, QVBoxLayout
 from PyQt5.QtWidgets import QDialog, QDialogButtonBox, QFileDialog, QMessageBox
 from PyQt5.QtWidgets import QApplication, QMainWindow
-import requests
-import bikereg
 from cheatsheet import CheatSheet
 import common
 import defaults
-import ontheday
 from preferences import PreferencesWindow
 from racebuilder import Builder
 from raceclock import DigitalClock
 from racemodel import DatabaseError, ModelDatabase, RaceTableModel
 from raceview import FieldTableView, JournalTableView, RacerTableView, ResultTableView
 import remotes
-from reports import ReportsWindow
 
 __copyright__ = '''
     Copyright (C) 2018-2019 Andrew Chew
@@ -53,6 +49,16 @@ __status__ = common.STATUS
 
 INPUT_TEXT_POINT_SIZE = 32
 
+# Allowed characters in the result input box.
+RESULT_INPUT_REGEXP = QRegExp('[A-Za-z0-9]*')
+
+# Status bar messages for the remote states.
+REMOTE_STATUS_MESSAGES = {
+    remotes.Status.Ok: 'Remote: Ok',
+    remotes.Status.TimedOut: 'Remote: Timed Out',
+    remotes.Status.Rejected: 'Remote: Rejected'
+}
+
 # Widget Instance Hierarchy
 #
 # SexyThymeMainWindow
@@ -137,6 +143,10 @@ class StartCentralWidget(QLabel, CentralWidget):
     import a race setup, etc.)
     """
 
+    # The title graphic is loaded on first use, and then shared by every instance. It can't be
+    # loaded at import time, because a QPixmap needs the QApplication to exist.
+    pixmap = None
+
     def __init__(self, parent=None):
         """Initialize the StartCentralWidget instance.
 
@@ -144,7 +154,11 @@ class StartCentralWidget(QLabel, CentralWidget):
         """
         super().__init__(parent=parent)
 
-        self.setPixmap(QPixmap(os.path.join(common.app_path(), 'resources', 'thyme.jpg')))
+        if StartCentralWidget.pixmap is None:
+            StartCentralWidget.pixmap = QPixmap(os.path.join(common.app_path(), 'resources',
+                                                             'thyme.jpg'))
+
+        self.setPixmap(StartCentralWidget.pixmap)
 
 class MainCentralWidget(QWidget, CentralWidget):
     """Main Central Widget.
@@ -190,12 +204,15 @@ class MainCentralWidget(QWidget, CentralWidget):
         font = self.result_input.font()
         font.setPointSize(INPUT_TEXT_POINT_SIZE)
         self.result_input.setFont(font)
-        self.result_input.setValidator(QRegExpValidator(QRegExp('[A-Za-z0-9]*')))
+        self.result_input.setValidator(QRegExpValidator(RESULT_INPUT_REGEXP))
 
         # Submit button.
         self.submit_button = QPushButton()
         self.submit_button.setToolTip('Submit selected results')
-        self.result_selection_changed(QItemSelection(), QItemSelection())
+        # Nothing can be selected in a freshly made result table view, so start off the same way
+        # result_selection_changed() would for an empty selection.
+        self.submit_button.setText('Submit')
+        self.submit_button.setEnabled(False)
 
         # Add to top-level layout.
         self.layout().addWidget(self.button_row)
@@ -217,16 +234,17 @@ class MainCentralWidget(QWidget, CentralWidget):
         self.return_focus_to_result_input()
 
         # Signals/slots for button row toggle buttons.
-        self.button_row.field_button.toggled.connect(self.field_table_view
-                                                         .setVisible)
-        self.field_table_view.visibleChanged.connect(self.button_row.field_button
-                                                         .setChecked)
-        self.button_row.racer_button.toggled.connect(self.racer_table_view
-                                                         .setVisible)
-        self.racer_table_view.visibleChanged.connect(self.button_row.racer_button
-                                                         .setChecked)
-
-        # Signals/slots for field name change notification.
+        for button, view in ((self.button_row.field_button, self.field_table_view),
+                             (self.button_row.racer_button, self.racer_table_view)):
+            button.toggled.connect(view.setVisible)
+            view.visibleChanged.connect(button.setChecked)
+
+        # Signals/slots for field name change notification. A single edit can come with several
+        # dataChanged signals, so refresh once the burst is over, instead of after every one.
+        self.field_refresh_timer = QTimer(self)
+        self.field_refresh_timer.setSingleShot(True)
+        self.field_refresh_timer.setInterval(0)
+        self.field_refresh_timer.timeout.connect(self.refresh_field_names)
         self.modeldb.field_table_model.dataChanged.connect(self.field_model_changed)
 
         # Signals/slots for result table.
@@ -242,28 +260,17 @@ class MainCentralWidget(QWidget, CentralWidget):
         self.submit_button.clicked.connect(self.handle_result_submit)
 
         # Signals/slots for keyboard shortcuts.
-        shortcut = QShortcut(QKeySequence(QKeySequence.HelpContents), self)
-        shortcut.activated.connect(self.handle_cheat_sheet_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+S'), self)
-        shortcut.activated.connect(self.handle_submit_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+A'), self)
-        shortcut.activated.connect(self.handle_select_all_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+D'), self)
-        shortcut.activated.connect(self.handle_deselect_all_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+R'), self)
-        shortcut.activated.connect(self.handle_racer_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+F'), self)
-        shortcut.activated.connect(self.handle_field_shortcut)
-
-        shortcut = QShortcut(QKeySequence('CTRL+J'), self)
-        shortcut.activated.connect(self.handle_journal_shortcut)
-        shortcut = QShortcut(QKeySequence('CTRL+L'), self)
-        shortcut.activated.connect(self.handle_journal_shortcut)
+        shortcut_list = [(QKeySequence.HelpContents, self.handle_cheat_sheet_shortcut),
+                         ('CTRL+S', self.handle_submit_shortcut),
+                         ('CTRL+A', self.handle_select_all_shortcut),
+                         ('CTRL+D', self.handle_deselect_all_shortcut),
+                         ('CTRL+R', self.handle_racer_shortcut),
+                         ('CTRL+F', self.handle_field_shortcut),
+                         ('CTRL+J', self.handle_journal_shortcut),
+                         ('CTRL+L', self.handle_journal_shortcut)]
+
+        for key, slot in shortcut_list:
+            QShortcut(QKeySequence(key), self).activated.connect(slot)
 
     def closeEvent(self, event): #pylint: disable=invalid-name
         """Clean up the MainCentralWidget instance.
@@ -276,8 +283,10 @@ class MainCentralWidget(QWidget, CentralWidget):
         self.cheat_sheet.hide()
         self.journal_table_view.hide()
 
+        self.field_refresh_timer.stop()
+
         racer_in_field_table_view_dict = self.field_table_view.racer_in_field_table_view_dict
-        for _, racer_table_view in racer_in_field_table_view_dict.items():
+        for racer_table_view in racer_in_field_table_view_dict.values():
             racer_table_view.hide()
 
         self.modeldb.cleanup()
@@ -308,6 +317,14 @@ class MainCentralWidget(QWidget, CentralWidget):
                                                field_table_model.name_column):
             return
 
+        self.field_refresh_timer.start()
+
+    def refresh_field_names(self):
+        """Reselect the models that show field names, after the field names have changed.
+
+        Neither of these models is the field table model, so reselecting them doesn't come back
+        around to field_model_changed().
+        """
         racer_table_model = self.modeldb.racer_table_model
         field_relation_model = racer_table_model.relationModel(racer_table_model.field_column)
 
@@ -322,8 +339,13 @@ class MainCentralWidget(QWidget, CentralWidget):
         """
         del selected, deselected
 
-        selection_count = len(self.result_table_view.selectionModel().selectedRows())
-        total_count = self.result_table_view.model().rowCount()
+        selection_model = self.result_table_view.selectionModel()
+
+        # Don't bother building the list of selected rows if there isn't any selection.
+        if selection_model.hasSelection():
+            selection_count = len(selection_model.selectedRows())
+        else:
+            selection_count = 0
 
         if selection_count == 0:
             self.submit_button.setText('Submit')
@@ -331,7 +353,8 @@ class MainCentralWidget(QWidget, CentralWidget):
         elif selection_count == 1:
             self.submit_button.setText('Submit')
             self.submit_button.setEnabled(True)
-        elif selection_count < total_count:
+        # Only need the total row count to tell "some" from "all".
+        elif selection_count < self.result_table_view.model().rowCount():
             self.submit_button.setText('Submit Selected')
             self.submit_button.setEnabled(True)
         else:
@@ -340,13 +363,17 @@ class MainCentralWidget(QWidget, CentralWidget):
 
     def new_result(self):
         """Handle a new result being entered in the result scratch pad input box."""
-        race_table_model = self.modeldb.race_table_model
+        # Grab the finish time first, before doing anything else, so that the time recorded is as
+        # close as possible to the actual key press.
+        current_datetime = QDateTime.currentDateTime()
 
-        scratchpad = self.result_input.text()
-        msecs = race_table_model.get_reference_clock_datetime().msecsTo(QDateTime.currentDateTime())
-        self.modeldb.result_table_model.add_result(scratchpad, msecs)
+        modeldb = self.modeldb
 
-        self.result_table_view.scrollToBottom()
+        reference_datetime = modeldb.race_table_model.get_reference_clock_datetime()
+        msecs = reference_datetime.msecsTo(current_datetime)
+        modeldb.result_table_model.add_result(self.result_input.text(), msecs)
+
+        self.result_table_view.scroll_timer.start()
         self.result_input.clear()
         self.result_table_view.setFocusProxy(None)
 
@@ -378,7 +405,7 @@ class MainCentralWidget(QWidget, CentralWidget):
         If there is no selection, then just try to submit everything in the results list.
         Otherwise, this is basically a shortcut to the submit button.
         """
-        if not self.result_table_view.selectedIndexes():
+        if not self.result_table_view.selectionModel().hasSelection():
             self.result_table_view.selectAll()
 
         self.handle_result_submit()
@@ -438,10 +465,16 @@ class SexyThymeMainWindow(QMainWindow):
     is connected, and is used to show remote status).
     """
 
+    # Group name for this window's QSettings.
+    QSETTINGS_GROUP = 'SexyThymeMainWindow'
+
     def __init__(self, filename=None, parent=None):
         """Initialize the SexyThymeMainWindow instance."""
         super().__init__(parent=parent)
 
+        # Hang on to one QSettings instance for reading and writing our settings.
+        self.settings = QSettings()
+
         self.read_settings()
 
         self.setup_menubar()
@@ -455,6 +488,7 @@ class SexyThymeMainWindow(QMainWindow):
         shortcut.activated.connect(self.preferences_window.wall_times_checkbox.toggle)
 
         self.reports_window = None
+        self.about_dialog = None
 
         if filename:
             try:
@@ -486,32 +520,47 @@ class SexyThymeMainWindow(QMainWindow):
 
     def switch_to_main(self, filename, new=False):
         """Switch to the MainCentralWidget as our central widget."""
-        # Clean up old central widget, which will clean up the model we gave it.
-        if self.centralWidget():
-            self.centralWidget().close()
+        # If this race file is already the one loaded, there is nothing to do. Tearing down and
+        # rebuilding the model and all of the views would just give us back what we already have.
+        # (A new race file always gets rebuilt, since the old file is deleted.)
+        central_widget = self.centralWidget()
+        if (not new and central_widget and central_widget.has_model() and
+            os.path.abspath(central_widget.modeldb.filename) == os.path.abspath(filename)):
+            return
 
-        # Window title should be the path-less, extension-less name of the race file.
-        basename, _ = os.path.splitext(os.path.basename(filename))
-        self.setWindowTitle(basename)
+        # Hold off repainting while the central widget and its child views are swapped out and
+        # populated, so that the window is only redrawn once, with the final contents.
+        self.setUpdatesEnabled(False)
+        try:
+            # Clean up old central widget, which will clean up the model we gave it.
+            if self.centralWidget():
+                self.centralWidget().close()
 
-        # Make a new model, and give it to a new central widget.
-        model = ModelDatabase(filename, new)
+            # Window title should be the path-less, extension-less name of the race file.
+            basename, _ = os.path.splitext(os.path.basename(filename))
+            self.setWindowTitle(basename)
 
-        self.setCentralWidget(MainCentralWidget(model))
+            # Make a new model, and give it to a new central widget.
+            model = ModelDatabase(filename, new)
 
-        self.close_file_menu_action.setEnabled(True)
-        self.race_builder_menu.setEnabled(True)
-        self.generate_reports_menu_action.setEnabled(True)
-        self.cheat_sheet_action.setEnabled(True)
-        self.journal_action.setEnabled(True)
+            self.setCentralWidget(MainCentralWidget(model))
 
-        remote_class_string = model.race_table_model.get_race_property(RaceTableModel.REMOTE_CLASS)
-        if remote_class_string:
-            self.connect_remote(remotes.get_remote_class_from_string(remote_class_string))
-        else:
-            self.set_remote(None)
+            self.close_file_menu_action.setEnabled(True)
+            self.race_builder_menu.setEnabled(True)
+            self.generate_reports_menu_action.setEnabled(True)
+            self.cheat_sheet_action.setEnabled(True)
+            self.journal_action.setEnabled(True)
 
-        self.centralWidget().connect_preferences(self.preferences_window)
+            race_table_model = model.race_table_model
+            remote_class_string = race_table_model.get_race_property(RaceTableModel.REMOTE_CLASS)
+            if remote_class_string:
+                self.connect_remote(remotes.get_remote_class_from_string(remote_class_string))
+            else:
+                self.set_remote(None)
+
+            self.centralWidget().connect_preferences(self.preferences_window)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setup_menubar(self):
         """Set up our menu bar."""
@@ -548,11 +597,9 @@ class SexyThymeMainWindow(QMainWindow):
 
         config_menu.addSeparator()
 
+        # The remote list is only filled in the first time the menu is about to be shown.
         self.connect_remote_menu = config_menu.addMenu('Connect Remote')
-        remote_class_list = remotes.get_remote_class_list()
-        for remote_class in remote_class_list:
-            receiver = lambda remote_class=remote_class: self.connect_remote(remote_class)
-            self.connect_remote_menu.addAction(remote_class.name, receiver)
+        self.connect_remote_menu.aboutToShow.connect(self.populate_connect_remote_menu)
 
         self.disconnect_remote_menu = config_menu.addAction('Disconnect Remote',
                                                             self.disconnect_remote)
@@ -562,6 +609,16 @@ class SexyThymeMainWindow(QMainWindow):
         self.cheat_sheet_action = help_menu.addAction('Show Cheat Sheet', self.help_cheat_sheet)
         self.journal_action = help_menu.addAction('Show Journal', self.help_journal)
 
+    def populate_connect_remote_menu(self):
+        """Fill in the Connect Remote menu with the available remote classes, if not done yet."""
+        if not self.connect_remote_menu.isEmpty():
+            return
+
+        remote_class_list = remotes.get_remote_class_list()
+        for remote_class in remote_class_list:
+            receiver = lambda remote_class=remote_class: self.connect_remote(remote_class)
+            self.connect_remote_menu.addAction(remote_class.name, receiver)
+
     def keyPressEvent(self, event): #pylint: disable=invalid-name
         """Handle key presses."""
         if event.key() == Qt.Key_Escape:
@@ -668,9 +725,10 @@ class SexyThymeMainWindow(QMainWindow):
 
         import_filename = dialog.selectedFiles()[0]
 
-        # If we are not yet initialized, pick a new race file.
+        # If we are not yet initialized, pick a new race file. Just reconfigure the dialog we
+        # already have, which is already sitting in the directory the import file came from.
         if not self.centralWidget().has_model():
-            dialog = common.FileDialog(self)
+            dialog.selectFile('')
             dialog.setAcceptMode(QFileDialog.AcceptSave)
             dialog.setDefaultSuffix('rce')
             dialog.setFileMode(QFileDialog.AnyFile)
@@ -692,18 +750,16 @@ class SexyThymeMainWindow(QMainWindow):
 
         # Get Field and Racer tables so we can whine about how much state
         # we're going to lose if we let the import happen.
-        field_table_model = self.centralWidget().modeldb.field_table_model
-        racer_table_model = self.centralWidget().modeldb.racer_table_model
+        modeldb = self.centralWidget().modeldb
+        field_count = modeldb.field_table_model.rowCount()
+        racer_count = modeldb.racer_table_model.rowCount()
 
-        if ((field_table_model.rowCount() != 0) or
-            (racer_table_model.rowCount() != 0)):
+        if (field_count != 0) or (racer_count != 0):
             msg_box = QMessageBox()
             msg_box.setWindowTitle(common.APPLICATION_NAME)
             msg_box.setText('Overwriting %s!' %
-                            common.pretty_list([common.pluralize('field',
-                                                                 field_table_model.rowCount()),
-                                                common.pluralize('racer',
-                                                                 racer_table_model.rowCount())]))
+                            common.pretty_list([common.pluralize('field', field_count),
+                                                common.pluralize('racer', racer_count)]))
             msg_box.setInformativeText('Do you really want to overwrite ' +
                                        'this data?')
             msg_box.setStandardButtons(QMessageBox.Ok |
@@ -715,7 +771,7 @@ class SexyThymeMainWindow(QMainWindow):
                 return None
 
         # Reuse old filename.
-        filename = self.centralWidget().modeldb.filename
+        filename = modeldb.filename
         try:
             self.switch_to_main(filename, True)
         except DatabaseError as e:
@@ -736,25 +792,27 @@ class SexyThymeMainWindow(QMainWindow):
         if not import_filename:
             return
 
-        bikereg.import_csv(self.centralWidget().modeldb, import_filename)
+        import bikereg
 
-        self.centralWidget().modeldb.add_defaults()
+        central_widget = self.centralWidget()
+        modeldb = central_widget.modeldb
+
+        bikereg.import_csv(modeldb, import_filename)
+
+        modeldb.add_defaults()
 
         # Open the racer and field windows so that the import actually looks like it did something.
-        self.centralWidget().button_row.racer_button.click()
-        self.centralWidget().button_row.field_button.click()
+        central_widget.button_row.racer_button.click()
+        central_widget.button_row.field_button.click()
 
         # Show import summary.
-        field_table_model = self.centralWidget().modeldb.field_table_model
-        racer_table_model = self.centralWidget().modeldb.racer_table_model
+        field_count = modeldb.field_table_model.rowCount()
+        racer_count = modeldb.racer_table_model.rowCount()
 
-        if ((field_table_model.rowCount() != 0) or
-            (racer_table_model.rowCount() != 0)):
+        if (field_count != 0) or (racer_count != 0):
             message_text = (('Imported %s. ' %
-                             common.pretty_list([common.pluralize('field',
-                                                                  field_table_model.rowCount()),
-                                          common.pluralize('racer',
-                                                           racer_table_model.rowCount())])) +
+                             common.pretty_list([common.pluralize('field', field_count),
+                                                 common.pluralize('racer', racer_count)])) +
                             'Would you like to open the Race Builder to assign start times?')
 
             msg_box = QMessageBox()
@@ -769,10 +827,13 @@ class SexyThymeMainWindow(QMainWindow):
 
             if msg_box.exec() == QMessageBox.Ok:
                 self.config_builder()
-                self.centralWidget().builder.setCurrentIndex(1)
+                central_widget.builder.setCurrentIndex(1)
 
     def import_ontheday_race_config(self):
         """Call ontheday module to import race config."""
+        import requests
+        import ontheday
+
         ontheday_import_wizard = ontheday.ImportWizard()
         if ontheday_import_wizard.exec() == QDialog.Rejected:
             return
@@ -791,8 +852,10 @@ class SexyThymeMainWindow(QMainWindow):
             self.switch_to_start()
             return
 
+        modeldb = self.centralWidget().modeldb
+
         if ontheday_import_wizard.enable_reference_clock:
-            race_table_model = self.centralWidget().modeldb.race_table_model
+            race_table_model = modeldb.race_table_model
 
             old_datetime = race_table_model.get_reference_clock_datetime()
             new_datetime = ontheday_import_wizard.reference_clock
@@ -806,7 +869,7 @@ class SexyThymeMainWindow(QMainWindow):
             QMessageBox.information(self, 'Info', message)
 
         try:
-            ontheday.import_race(self.centralWidget().modeldb, auth, race)
+            ontheday.import_race(modeldb, auth, race)
         except requests.exceptions.HTTPError:
             QMessageBox.warning(self, 'Error', 'Authentication failure')
             return
@@ -814,17 +877,15 @@ class SexyThymeMainWindow(QMainWindow):
             QMessageBox.warning(self, 'Error', 'Import timeout')
             return
 
-        self.centralWidget().modeldb.add_defaults()
+        modeldb.add_defaults()
 
         # Show import summary, and ask if we want to set up the remote connection.
-        field_table_model = self.centralWidget().modeldb.field_table_model
-        racer_table_model = self.centralWidget().modeldb.racer_table_model
+        field_count = modeldb.field_table_model.rowCount()
+        racer_count = modeldb.racer_table_model.rowCount()
 
         message_text = (('Imported %s. ' %
-                         common.pretty_list([common.pluralize('field',
-                                                              field_table_model.rowCount()),
-                                      common.pluralize('racer',
-                                                       racer_table_model.rowCount())])) +
+                         common.pretty_list([common.pluralize('field', field_count),
+                                             common.pluralize('racer', racer_count)])) +
                         'Would you like to set up the OnTheDay.net remote connection?')
 
         msg_box = QMessageBox()
@@ -843,6 +904,7 @@ class SexyThymeMainWindow(QMainWindow):
     def generate_reports(self):
         """Show the reports window."""
         if not self.reports_window:
+            from reports import ReportsWindow
             self.reports_window = ReportsWindow(self.centralWidget().modeldb, self)
         self.reports_window.show()
 
@@ -898,26 +960,26 @@ class SexyThymeMainWindow(QMainWindow):
 
         This amounts to changing the text in the status bar.
         """
-        if status == remotes.Status.Ok:
-            self.statusBar().showMessage('Remote: Ok')
-        elif status == remotes.Status.TimedOut:
-            self.statusBar().showMessage('Remote: Timed Out')
-        elif status == remotes.Status.Rejected:
-            self.statusBar().showMessage('Remote: Rejected')
-        else:
-            self.statusBar().showMessage('Remote: Unknown State')
+        self.statusBar().showMessage(REMOTE_STATUS_MESSAGES.get(status, 'Remote: Unknown State'))
 
     def help_about(self):
         """Show about dialog."""
-        AboutDialog(self).show()
+        if not self.about_dialog:
+            self.about_dialog = AboutDialog(self)
+        self.about_dialog.setVisible(True)
+        self.about_dialog.raise_()
 
     def help_cheat_sheet(self):
         """Show cheat sheet."""
-        self.centralWidget().cheat_sheet.show()
+        cheat_sheet = self.centralWidget().cheat_sheet
+        cheat_sheet.setVisible(True)
+        cheat_sheet.raise_()
 
     def help_journal(self):
-        """Show about dialog."""
-        self.centralWidget().journal_table_view.show()
+        """Show journal."""
+        journal_table_view = self.centralWidget().journal_table_view
+        journal_table_view.setVisible(True)
+        journal_table_view.raise_()
 
     def should_close(self):
         """Ask user if we really want to close the app."""
@@ -926,8 +988,9 @@ class SexyThymeMainWindow(QMainWindow):
         # If there are unsubmitted results, give the user a chance to cancel
         # the quit...not that the user will lose anything, but just as a heads
         # up that there's unfinished business on the part of the user.
-        if (self.centralWidget().has_model() and
-            (self.centralWidget().result_table_view.model().rowCount() != 0)):
+        central_widget = self.centralWidget()
+        if (central_widget.has_model() and
+            (central_widget.result_table_view.model().rowCount() != 0)):
             msg_box = QMessageBox()
             msg_box.setWindowTitle(common.APPLICATION_NAME)
             msg_box.setText('You have unsubmitted results.')
@@ -950,7 +1013,13 @@ class SexyThymeMainWindow(QMainWindow):
         Couldn't use a lambda for this since I have to show() afterwards.
         Still, there's issues with this...it doesn't really work. Supposedly,
         worked in Qt4, so this is a regression.
+
+        Changing window flags recreates the native window, so don't touch anything if the flag is
+        already in the requested state.
         """
+        if bool(self.windowFlags() & Qt.WindowStaysOnTopHint) == bool(state):
+            return
+
         self.setWindowFlag(Qt.WindowStaysOnTopHint, state)
         self.show()
 
@@ -961,24 +1030,42 @@ class SexyThymeMainWindow(QMainWindow):
 
     def read_settings(self):
         """Read settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
+        group_name = self.QSETTINGS_GROUP
+        settings = self.settings
         settings.beginGroup(group_name)
 
-        if settings.contains('size'):
-            self.resize(settings.value('size'))
-        if settings.contains('pos'):
-            self.move(settings.value('pos'))
+        # value() returns None for a missing key, so each key is only looked up once.
+        geometry = settings.value('geometry')
+        if geometry is not None and not geometry.isEmpty():
+            self.restoreGeometry(geometry)
+        else:
+            # Older versions saved size and pos separately.
+            size = settings.value('size')
+            if size is not None:
+                self.resize(size)
+            pos = settings.value('pos')
+            if pos is not None:
+                self.move(pos)
 
         settings.endGroup()
 
+        # Remember what was restored, so that write_settings() can skip an unchanged geometry.
+        self.saved_geometry = geometry
+
     def write_settings(self):
         """Write settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
+        geometry = self.saveGeometry()
+        if geometry == self.saved_geometry:
+            return
+
+        group_name = self.QSETTINGS_GROUP
+        settings = self.settings
         settings.beginGroup(group_name)
 
-        settings.setValue('size', self.size())
-        settings.setValue('pos', self.pos())
+        settings.setValue('geometry', geometry)
+        settings.remove('size')
+        settings.remove('pos')
 
         settings.endGroup()
+
+        self.saved_geometry = geometry
@@ -31,7 +31,7 @@ import requests
 import keyring
 import common
 import defaults
-from racemodel import MSECS_DNP, MSECS_UNINITIALIZED
+from racemodel import InputError, Journal, MSECS_DNP, MSECS_UNINITIALIZED
 
 __copyright__ = '''
     Copyright (C) 2018-2019 Andrew Chew
@@ -223,6 +223,7 @@ def import_race(modeldb, auth, race):
     """
     # Import racers (fields will be implicitly imported).
     field_table_model = modeldb.field_table_model
+    journal = Journal(modeldb.journal_table_model, 'ontheday')
 
     field_list = get_field_list(auth, race)
 
@@ -252,8 +253,18 @@ def import_race(modeldb, auth, race):
 
         racer_list = get_racer_list(auth, field)
 
-        for racer in racer_list:
-            add_racer_to_modeldb(modeldb, racer, field['name'], start)
+        # Write the whole field's worth of racers in one go. The import can simply be redone if we
+        # crash in the middle of it.
+        with modeldb.bulk(synchronous=False):
+            for racer in racer_list:
+                # One racer we can't take (say, with a missing or non-numeric race number)
+                # shouldn't sink the rest of the field, so skip it, and say why in the journal.
+                try:
+                    add_racer_to_modeldb(modeldb, racer, field['name'], start)
+                except InputError as e:
+                    journal.log('Skipped racer "%s %s" in field "%s": %s' %
+                                (racer.get('firstname', ''), racer.get('lastname', ''),
+                                 field['name'], e))
 
     # Set race data.
     race_table_model = modeldb.race_table_model
@@ -916,8 +927,9 @@ class FieldStatisticsTable(QTableWidget):
         if settings.contains('pos'):
             self.move(settings.value('pos'))
 
-        if settings.contains('horizontal_header_state'):
-            self.horizontalHeader().restoreState(settings.value('horizontal_header_state'))
+        header_state = settings.value('horizontal_header_state')
+        if header_state is not None and not header_state.isEmpty():
+            self.horizontalHeader().restoreState(header_state)
 
         settings.endGroup()
 
@@ -79,6 +79,35 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
         self.layout_change_persistent_indexes = []
         self.layout_change_proxy_columns = []
 
+        # Qt asks for the column count, directly and through extraColumnForProxyColumn(), on
+        # nearly every index, data, flags and header query, so keep the source's count around
+        # and only refresh it when the source model tells us its columns may have changed.
+        self.source_column_count = 0
+
+    def setSourceModel(self, source_model): #pylint: disable=invalid-name
+        """Reimplemented."""
+        old_source_model = self.sourceModel()
+        if old_source_model:
+            old_source_model.columnsInserted.disconnect(self.updateSourceColumnCount)
+            old_source_model.columnsRemoved.disconnect(self.updateSourceColumnCount)
+            old_source_model.modelReset.disconnect(self.updateSourceColumnCount)
+
+        # Connect before QIdentityProxyModel does, so that the count is already up to date by the
+        # time our own columnsInserted/columnsRemoved/modelReset reach the views.
+        if source_model:
+            source_model.columnsInserted.connect(self.updateSourceColumnCount)
+            source_model.columnsRemoved.connect(self.updateSourceColumnCount)
+            source_model.modelReset.connect(self.updateSourceColumnCount)
+
+        super().setSourceModel(source_model)
+
+        self.updateSourceColumnCount()
+
+    def updateSourceColumnCount(self): #pylint: disable=invalid-name
+        """Refresh the cached column count of the source model."""
+        source_model = self.sourceModel()
+        self.source_column_count = source_model.columnCount() if source_model else 0
+
     def appendColumn(self, header): #pylint: disable=invalid-name
         """Append an extra column.
 
@@ -138,7 +167,7 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
             return QModelIndex()
 
         column = proxy_index.column()
-        if column >= self.sourceModel().columnCount():
+        if column >= self.source_column_count:
             print('Returning invalid index in mapToSource')
             return QModelIndex()
 
@@ -147,7 +176,7 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
     def buddy(self, proxy_index):
         """Reimplemented."""
         column = proxy_index.column()
-        if column >= self.sourceModel().columnCount():
+        if column >= self.source_column_count:
             return proxy_index
 
         return super().buddy(proxy_index)
@@ -166,14 +195,14 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
         if not self.sourceModel():
             return source_selection
 
-        source_column_count = self.sourceModel().columnCount()
         for item in selection:
             top_left = item.topLeft()
             top_left = top_left.sibling(top_left.row(), 0)
 
             bottom_right = item.bottomRight()
-            if bottom_right.column() >= source_column_count:
-                bottom_right = bottom_right.sibling(bottom_right.row(), source_column_count - 1)
+            if bottom_right.column() >= self.source_column_count:
+                bottom_right = bottom_right.sibling(bottom_right.row(),
+                                                    self.source_column_count - 1)
 
             selection_range = QItemSelectionRange(self.mapToSource(top_left),
                                                   self.mapToSource(bottom_right))
@@ -185,7 +214,10 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
 
     def columnCount(self, parent=QModelIndex()): #pylint: disable=invalid-name
         """Reimplemented."""
-        return super().columnCount(parent) + len(self.extra_headers)
+        if parent.isValid():
+            return super().columnCount(parent) + len(self.extra_headers)
+
+        return self.source_column_count + len(self.extra_headers)
 
     def extraColumnCount(self, parent=QModelIndex()): #pylint: disable=invalid-name
         """Just a count of the extra headers."""
@@ -257,9 +289,8 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
 
         This basically means subtracting the amount of columns in the source model.
         """
-        source_column_count = self.sourceModel().columnCount()
-        if proxy_column >= source_column_count:
-            return proxy_column - source_column_count
+        if proxy_column >= self.source_column_count:
+            return proxy_column - self.source_column_count
 
         return -1
 
@@ -268,7 +299,7 @@ class ExtraColumnsProxyModel(QIdentityProxyModel):
 
         This basically means adding the amount of columns in the source model.
         """
-        return self.sourceModel().columnCount() + extra_column
+        return self.source_column_count + extra_column
 
 class RearrangeColumnsProxyModel(QIdentityProxyModel):
     """RearrangeColumnsProxyModel
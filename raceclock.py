@@ -8,7 +8,7 @@ with Internet (cellphone) time.
 """
 
 import ntplib
-from PyQt5.QtCore import QDate, QDateTime, QTime, QTimer
+from PyQt5.QtCore import QDate, QDateTime, Qt, QTime, QTimer
 from PyQt5.QtWidgets import QFrame, QLCDNumber, QMessageBox
 import common
 from defaults import NTP_SERVER_NUM_CHECKS
@@ -58,10 +58,13 @@ class DigitalClock(QLCDNumber):
         self.setFrameShape(QFrame.NoFrame)
         self.setSegmentStyle(QLCDNumber.Filled)
 
+        # The display only has a resolution of one second, so instead of polling, a single-shot
+        # timer is rescheduled on each update to fire right at the next second boundary.
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update)
         self.update()
-        self.timer.start(100)
 
         self.setMinimumHeight(48)
 
@@ -85,6 +88,8 @@ class DigitalClock(QLCDNumber):
 
         self.display(text)
 
+        self.timer.start(1000 - msecs % 1000)
+
     def validate_clock(self):
         """Check against an NTP server to see if our system time is in sync.
 
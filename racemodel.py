@@ -15,12 +15,15 @@ various table classes don't operate independently from one another...there are i
 and they get to sibling tables via the ModelDatabase instance.
 """
 
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
 import os
 import sys
-from PyQt5.QtCore import QDate, QDateTime, QModelIndex, QObject, Qt, QTime
+from PyQt5.QtCore import QDate, QDateTime, QModelIndex, QObject, Qt
 from PyQt5.QtGui import QBrush, QTextDocument
-from PyQt5.QtSql  import QSqlDatabase, QSqlQuery, QSqlRelation, QSqlRelationalTableModel, \
-                         QSqlTableModel
+from PyQt5.QtSql  import QSqlDatabase, QSqlQuery, QSqlRecord, QSqlRelation, \
+                         QSqlRelationalTableModel, QSqlTableModel
 from PyQt5.QtWidgets import QPlainTextDocumentLayout
 import common
 import defaults
@@ -67,30 +70,47 @@ def msecs_is_valid(msecs):
     """Returns whether msecs holds a valid (non-negative) elapsed time."""
     return msecs > MSECS_SMALLEST_VALID
 
+# Brushes for color-coding table cells. These never change, so there's no need to make new ones
+# every time a cell gets painted.
+RED_BRUSH = QBrush(Qt.red)
+YELLOW_BRUSH = QBrush(Qt.yellow)
+GREEN_BRUSH = QBrush(Qt.green)
+
+# For breaking msecs up into days, hours, minutes, seconds, and msecs.
+MSECS_PER_SECOND = 1000
+MSECS_PER_MINUTE = 60 * MSECS_PER_SECOND
+MSECS_PER_HOUR = 60 * MSECS_PER_MINUTE
+MSECS_PER_DAY = 24 * MSECS_PER_HOUR
+
+# String representation of the msecs values that aren't valid times.
+MSECS_INVALID_STRINGS = {MSECS_UNINITIALIZED: 'DNF',
+                         MSECS_DNF: 'DNF',
+                         MSECS_DNP: 'DNP',
+                         MSECS_DNS: 'DNS'}
+
+@lru_cache(maxsize=4096)
 def msecs_to_string(msecs):
-    """Return a string representation of time delta expressed as msecs."""
-    if msecs_is_valid(msecs):
-        days = msecs // (24 * 60 * 60 * 1000)
-        hours = (msecs - days) // (60 * 60 * 1000)
-
-        if days and hours:
-            string = QTime(0, 0).addMSecs(msecs).toString('%s days, h:mm:ss.zzz' % days)
-        elif days:
-            string = QTime(0, 0).addMSecs(msecs).toString('%s days, m:ss.zzz' % days)
-        elif hours:
-            string = QTime(0, 0).addMSecs(msecs).toString('h:mm:ss.zzz')
-        else:
-            string = QTime(0, 0).addMSecs(msecs).toString('m:ss.zzz')
-    elif msecs in (MSECS_DNF, MSECS_UNINITIALIZED):
-        string = 'DNF'
-    elif msecs == MSECS_DNP:
-        string = 'DNP'
-    elif msecs == MSECS_DNS:
-        string = 'DNS'
-    else:
-        string = 'unknown'
-
-    return string
+    """Return a string representation of time delta expressed as msecs.
+
+    Reports get regenerated over and over with mostly the same times, so remember the most recent
+    ones.
+    """
+    if not msecs_is_valid(msecs):
+        return MSECS_INVALID_STRINGS.get(msecs, 'unknown')
+
+    days, remainder = divmod(msecs, MSECS_PER_DAY)
+    hours, remainder = divmod(remainder, MSECS_PER_HOUR)
+    minutes, remainder = divmod(remainder, MSECS_PER_MINUTE)
+    seconds, remainder = divmod(remainder, MSECS_PER_SECOND)
+
+    if days and hours:
+        return '%s days, %d:%02d:%02d.%03d' % (days, hours, minutes, seconds, remainder)
+    if days:
+        return '%s days, %d:%02d.%03d' % (days, minutes, seconds, remainder)
+    if hours:
+        return '%d:%02d:%02d.%03d' % (hours, minutes, seconds, remainder)
+
+    return '%d:%02d.%03d' % (minutes, seconds, remainder)
 
 class DatabaseError(Exception):
     """Database Error exception
@@ -108,15 +128,16 @@ class InputError(Exception):
     telling the user that they did something wrong.
     """
 
-def _print_record(record):
-    """Print a Qt SQL record.
+if __debug__:
+    def _print_record(record):
+        """Print a Qt SQL record.
 
-    This is used for debugging.
-    """
-    for index in range(record.count()):
-        print('%s: %s, generated = %s' % (record.field(index).name(),
-                                          record.field(index).value(),
-                                          record.isGenerated(index)))
+        This is used for debugging.
+        """
+        for index in range(record.count()):
+            print('%s: %s, generated = %s' % (record.fieldName(index),
+                                              record.value(index),
+                                              record.isGenerated(index)))
 
 class ModelDatabase(QObject):
     """Model Database
@@ -131,9 +152,11 @@ class ModelDatabase(QObject):
         self.filename = filename
 
         if new:
-            # Delete the file, if it exists.
-            if os.path.exists(self.filename):
-                os.remove(self.filename)
+            # Delete the file, if it exists. Also delete any write-ahead log left behind for it, so
+            # that it doesn't get replayed into the new database.
+            for path in (self.filename, self.filename + '-wal', self.filename + '-shm'):
+                if os.path.exists(path):
+                    os.remove(path)
 
         self.db = QSqlDatabase.addDatabase('QSQLITE', self.filename)
 
@@ -145,6 +168,12 @@ class ModelDatabase(QObject):
         if not self.db.open():
             raise DatabaseError(self.db.lastError().text())
 
+        if filename != ':memory:':
+            self.set_pragmas()
+
+        # How deeply nested we are in bulk() blocks.
+        self.bulk_depth = 0
+
         # Make sure we make the journal table first, so we can immediately
         # start to use it.
         self.journal_table_model = JournalTableModel(self)
@@ -153,18 +182,105 @@ class ModelDatabase(QObject):
         self.racer_table_model = RacerTableModel(self)
         self.result_table_model = ResultTableModel(self)
 
+    def set_pragmas(self):
+        """Tune SQLite for the way we use it.
+
+        Almost every edit is its own little transaction, so use write-ahead logging, which makes
+        each commit a single append to the log. Keep synchronous mode FULL, though: in WAL mode,
+        NORMAL can lose the last few commits on a power failure, and the last commit is usually a
+        finish time that can't be taken again. Things that can simply be redone (like imports) turn
+        syncing off for themselves through bulk(synchronous=False), which puts back whatever
+        setting it found. Also wait a bit for locks instead of failing right away, and give SQLite
+        a bigger page cache.
+        """
+        query = QSqlQuery(self.db)
+
+        for pragma in ('PRAGMA journal_mode = WAL;',
+                       'PRAGMA synchronous = FULL;',
+                       'PRAGMA busy_timeout = 5000;',
+                       'PRAGMA cache_size = -20000;',
+                       'PRAGMA temp_store = MEMORY;'):
+            if not query.exec(pragma):
+                raise DatabaseError(query.lastError().text())
+            query.finish()
+
     def cleanup(self):
         """Close the database."""
         self.db.close()
         QSqlDatabase.removeDatabase(self.filename)
 
+    @contextmanager
+    def bulk(self, synchronous=True):
+        """Context manager that groups a bunch of edits into a single transaction.
+
+        Each edit made through the table models is otherwise committed (and synced) on its own.
+        Nested bulk() blocks just join the outermost one. If an exception gets raised out of the
+        block, or the commit fails, the transaction is rolled back, and the table models are
+        reselected so that they don't hold on to rows that no longer exist.
+
+        If synchronous is False, SQLite doesn't wait for the data to hit the disk when committing.
+        Only use this for stuff that can simply be redone if we crash in the middle of it (like an
+        import). It only has an effect on the outermost bulk() block.
+        """
+        if self.bulk_depth:
+            self.bulk_depth += 1
+            try:
+                yield
+            finally:
+                self.bulk_depth -= 1
+            return
+
+        query = QSqlQuery(self.db)
+
+        if not synchronous:
+            if not query.exec('PRAGMA synchronous;') or not query.next():
+                raise DatabaseError(query.lastError().text())
+            old_synchronous = query.value(0)
+            query.finish()
+
+            if not query.exec('PRAGMA synchronous = OFF;'):
+                raise DatabaseError(query.lastError().text())
+
+        self.bulk_depth = 1
+        try:
+            if not self.db.transaction():
+                raise DatabaseError(self.db.lastError().text())
+
+            # A failed commit leaves the transaction open, so it gets rolled back the same way as
+            # anything raised out of the block.
+            try:
+                yield
+
+                if not self.db.commit():
+                    raise DatabaseError(self.db.lastError().text())
+            except Exception:
+                self.db.rollback()
+
+                # Reselecting is only damage control, so don't let a failure here hide the
+                # exception that got us here.
+                for model in (self.journal_table_model, self.race_table_model,
+                              self.field_table_model, self.racer_table_model,
+                              self.result_table_model):
+                    try:
+                        model.select()
+                    except Exception: #pylint: disable=broad-except
+                        pass
+                raise
+        finally:
+            self.bulk_depth = 0
+
+            if not synchronous:
+                query.exec('PRAGMA synchronous = %s;' % old_synchronous)
+                query.finish()
+
     def add_defaults(self):
         """Add default table entries."""
-        self.journal_table_model.add_defaults()
-        self.race_table_model.add_defaults()
-        self.field_table_model.add_defaults()
-        self.racer_table_model.add_defaults()
-        self.result_table_model.add_defaults()
+        with self.bulk():
+            self.journal_table_model.add_defaults()
+            self.race_table_model.add_defaults()
+            self.field_table_model.add_defaults()
+            self.racer_table_model.add_defaults()
+            self.result_table_model.add_defaults()
 
 class Journal(QObject):
     """Journal helper class.
@@ -196,13 +312,24 @@ class TableModel(QSqlRelationalTableModel):
     of column flags. I'm not sure why the Qt SQL table model classes don't have these already.
     """
 
+    # (column name, header text) pairs, for set_headers().
+    HEADERS = ()
+
     def __init__(self, modeldb):
         """Initialize the TableModel instance."""
         super().__init__(db=modeldb.db)
 
         self.modeldb = modeldb
-        self.column_flags_to_add = {}
-        self.column_flags_to_remove = {}
+        self.column_flags_to_add = defaultdict(Qt.ItemFlags)
+        self.column_flags_to_remove = defaultdict(Qt.ItemFlags)
+
+        # Cache for find_row() (and so lookup()). It is kept up to date as cells change and rows
+        # get appended, and is thrown away for anything else.
+        self.row_cache = {}
+        self.dataChanged.connect(self.update_row_cache)
+        self.rowsInserted.connect(self.extend_row_cache)
+        self.rowsRemoved.connect(self.invalidate_caches)
+        self.modelReset.connect(self.invalidate_caches)
 
     def create_table(self):
         """Create the database table."""
@@ -211,39 +338,194 @@ class TableModel(QSqlRelationalTableModel):
     def add_defaults(self):
         """Add default table entries."""
 
+    def set_headers(self):
+        """Set the horizontal header text of the columns listed in the subclass's HEADERS.
+
+        HEADERS is a sequence of (column name, header text) pairs.
+        """
+        for name, text in self.HEADERS:
+            self.setHeaderData(self.fieldIndex(name), Qt.Horizontal, text)
+
+    @contextmanager
+    def manual_submit(self, strategy=QSqlTableModel.OnManualSubmit):
+        """Context manager for making a batch of edits through the model, and submitting them all
+        at once (in one transaction) at the end.
+
+        Signals are blocked while the edits are being made, so that views don't repaint after
+        every single one. With the default OnManualSubmit strategy, the submit at the end reselects
+        the model, which brings views up to date. Edits confined to a single row can use
+        OnRowChange instead, which only refreshes that row (and doesn't reset views). If anything
+        goes wrong, the edits are reverted.
+        """
+        self.setEditStrategy(strategy)
+
+        try:
+            signals_were_blocked = self.blockSignals(True)
+            try:
+                yield
+            finally:
+                self.blockSignals(signals_were_blocked)
+
+            with self.modeldb.bulk():
+                self.submitAll()
+        except Exception:
+            self.revertAll()
+            raise
+        finally:
+            self.setEditStrategy(QSqlTableModel.OnFieldChange)
+
+    def set_cell(self, row, column, value):
+        """Set the value of a single cell, and let views know about it."""
+        index = self.index(row, column)
+        self.setData(index, value)
+        self.dataChanged.emit(index, index)
+
+    def set_cells(self, row, changes):
+        """Set the values of several cells in the same row, all in one go.
+
+        "changes" is a list of (column, value) pairs. They get sent to the database as one UPDATE,
+        and views get a single dataChanged spanning the changed columns.
+        """
+        if not changes:
+            return
+
+        with self.manual_submit(QSqlTableModel.OnRowChange):
+            for column, value in changes:
+                self.setData(self.index(row, column), value)
+
+        changed_columns = [column for column, _ in changes]
+        self.dataChanged.emit(self.index(row, min(changed_columns)),
+                              self.index(row, max(changed_columns)))
+
+    def prepare_query(self, statement):
+        """Return a prepared query for the given statement.
+
+        Keep the returned query around and reuse it, so that the statement only has to be prepared
+        once.
+        """
+        query = QSqlQuery(self.database())
+
+        if not query.prepare(statement):
+            raise DatabaseError(query.lastError().text())
+
+        return query
+
+    def invalidate_caches(self):
+        """Throw away everything remembered by find_row() and lookup()."""
+        self.row_cache.clear()
+
+    def update_row_cache(self, top_left, bottom_right):
+        """Keep the find_row() cache up to date with changed cells."""
+        if not top_left.isValid() or not bottom_right.isValid():
+            self.row_cache.clear()
+            return
+
+        for column in list(self.row_cache):
+            if column < top_left.column() or column > bottom_right.column():
+                continue
+
+            row_dict, value_list = self.row_cache[column]
+
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                if row >= len(value_list):
+                    del self.row_cache[column]
+                    break
+
+                old_value = value_list[row]
+                new_value = self.data(self.index(row, column))
+
+                if new_value == old_value:
+                    continue
+
+                # Duplicate values in the column make this complicated, so just start over.
+                if row_dict.get(old_value) != row or new_value in row_dict:
+                    del self.row_cache[column]
+                    break
+
+                del row_dict[old_value]
+                row_dict[new_value] = row
+                value_list[row] = new_value
+
+    def extend_row_cache(self, parent, first, last):
+        """Keep the find_row() cache up to date with appended rows."""
+        del parent
+
+        for column in list(self.row_cache):
+            row_dict, value_list = self.row_cache[column]
+
+            # Anything but an append shifts the rows around, so just start over.
+            if first != len(value_list):
+                del self.row_cache[column]
+                continue
+
+            for row in range(first, last + 1):
+                value = self.data(self.index(row, column))
+
+                if value in row_dict:
+                    del self.row_cache[column]
+                    break
+
+                row_dict[value] = row
+                value_list.append(value)
+
+    def find_row(self, column, value):
+        """Return the first model row whose "column" holds "value", or None if there isn't one.
+
+        This goes by the model's (displayed) data, so it sees edits that have not made it to the
+        database yet. The first call for a column maps every value in that column to its row, so
+        that later calls are just a dict lookup.
+        """
+        if column not in self.row_cache:
+            value_list = [self.data(self.index(row, column)) for row in range(self.rowCount())]
+
+            row_dict = {}
+            for row, row_value in enumerate(value_list):
+                row_dict.setdefault(row_value, row)
+
+            self.row_cache[column] = (row_dict, value_list)
+
+        return self.row_cache[column][0].get(value)
+
+    def lookup(self, key_column, key, value_column):
+        """Return what's in "value_column" of the first row whose "key_column" holds "key".
+
+        Returns None if there is no such row. Like find_row(), this goes by the model's data
+        rather than asking the database, so it is already up to date inside a dataChanged slot
+        (which, under OnFieldChange, runs before the change is written to the table).
+        """
+        row = self.find_row(key_column, key)
+
+        if row is None:
+            return None
+
+        return self.data(self.index(row, value_column))
+
     def add_column_flags(self, column, flags):
         """Add flags to specified column.
 
         This is used by the flags() method to modify the column flags that are returned.
         """
-        if not column in self.column_flags_to_add.keys():
-            self.column_flags_to_add[column] = 0
-        self.column_flags_to_add[column] |= int(flags)
+        self.column_flags_to_add[column] |= flags
 
     def remove_column_flags(self, column, flags):
         """Remove flags from specified column.
 
         This is used by the flags() method to modify the column flags that are returned.
         """
-        if not column in self.column_flags_to_remove.keys():
-            self.column_flags_to_remove[column] = 0
-        self.column_flags_to_remove[column] |= int(flags)
+        self.column_flags_to_remove[column] |= flags
 
     def flags(self, model_index):
         """Override parent QSqlRelationalTableModel to modify the column flags returned."""
         flags = super().flags(model_index)
 
-        column = model_index.column()
-
-        if not column in self.column_flags_to_add.keys():
-            self.column_flags_to_add[column] = 0
-        flags |= self.column_flags_to_add[column]
+        # This gets called for every cell on every repaint, and usually there's nothing to modify.
+        if not self.column_flags_to_add and not self.column_flags_to_remove:
+            return flags
 
-        if not column in self.column_flags_to_remove.keys():
-            self.column_flags_to_remove[column] = 0
-        flags &= ~self.column_flags_to_remove[model_index.column()]
+        column = model_index.column()
 
-        return flags
+        return ((flags | self.column_flags_to_add.get(column, Qt.NoItemFlags)) &
+                ~self.column_flags_to_remove.get(column, Qt.NoItemFlags))
 
     def insertRecord(self, row, record): #pylint: disable=invalid-name
         """Redefine this so we can raise an exception.
@@ -322,6 +604,10 @@ class JournalTableModel(TableModel):
     TOPIC = 'topic'
     MESSAGE = 'message'
 
+    HEADERS = ((TIMESTAMP, 'Timestamp'),
+               (TOPIC, 'Topic'),
+               (MESSAGE, 'Message'))
+
     def __init__(self, modeldb):
         """Initialize the ResultTableModel instance."""
         super().__init__(modeldb)
@@ -337,9 +623,12 @@ class JournalTableModel(TableModel):
         self.topic_column = self.fieldIndex(self.TOPIC)
         self.message_column = self.fieldIndex(self.MESSAGE)
 
-        self.setHeaderData(self.timestamp_column, Qt.Horizontal, 'Timestamp')
-        self.setHeaderData(self.topic_column, Qt.Horizontal, 'Topic')
-        self.setHeaderData(self.message_column, Qt.Horizontal, 'Message')
+        self.set_headers()
+
+        # Template record for add_entry(), which gets called for just about everything that
+        # happens in the race.
+        self.journal_record = self.record()
+        self.journal_record.setGenerated(self.ID, False)
 
         self.select()
 
@@ -362,8 +651,9 @@ class JournalTableModel(TableModel):
         # Generate our time stamp here...no need for the caller to make one.
         timestamp = QDateTime.currentDateTime()
 
-        record = self.record()
-        record.setGenerated(self.ID, False)
+        # insertRecord() appends just the new row to the model (and lets views know through
+        # rowsInserted), rather than reselecting the whole journal.
+        record = QSqlRecord(self.journal_record)
         record.setValue(self.TIMESTAMP, timestamp)
         record.setValue(self.TOPIC, topic)
         record.setValue(self.MESSAGE, message)
@@ -405,6 +695,11 @@ class RaceTableModel(TableModel):
         self.key_column = self.fieldIndex(self.KEY)
         self.value_column = self.fieldIndex(self.VALUE)
 
+        # The notes document last handed out by get_notes() (or taken in by set_notes()), and the
+        # notes text that it was made from.
+        self.notes_document = None
+        self.notes_document_text = None
+
         self.select()
 
     def create_table(self):
@@ -435,15 +730,12 @@ class RaceTableModel(TableModel):
 
     def get_race_property(self, key):
         """Get the value of the race property corresponding to the "key"."""
-        index_list = self.match(self.index(0, self.key_column),
-                                Qt.DisplayRole, key, 1, Qt.MatchExactly)
+        row = self.find_row(self.key_column, key)
 
-        if not index_list:
+        if row is None:
             return None
 
-        index = index_list[0]
-
-        return self.data(self.index(index.row(), self.value_column))
+        return self.data(self.index(row, self.value_column))
 
     def set_race_property(self, key, value=''):
         """Set/add a value corresponding to "key".
@@ -451,10 +743,9 @@ class RaceTableModel(TableModel):
         Set the row corresponding to the given "key" to "value". If this row doesn't exist, add a
         new row.
         """
-        index_list = self.match(self.index(0, self.key_column),
-                                Qt.DisplayRole, key, 1, Qt.MatchExactly)
+        row = self.find_row(self.key_column, key)
 
-        if not index_list:
+        if row is None:
             record = self.record()
             record.setGenerated(self.ID, False)
             record.setValue(self.KEY, key)
@@ -463,20 +754,20 @@ class RaceTableModel(TableModel):
             self.insertRecord(-1, record)
             return
 
-        index = index_list[0]
-        self.setData(index.siblingAtColumn(self.value_column), value)
+        # Going through the model only updates (and refreshes) this one row, and views hear about
+        # it through dataChanged. Skip it altogether if the value isn't changing.
+        index = self.index(row, self.value_column)
+        if self.data(index) != value:
+            self.setData(index, value)
 
     def delete_race_property(self, key):
         """Delete a key/value entry from the database."""
-        index_list = self.match(self.index(0, self.key_column),
-                                Qt.DisplayRole, key, 1, Qt.MatchExactly)
+        row = self.find_row(self.key_column, key)
 
-        if not index_list:
+        if row is None:
             return
 
-        index = index_list[0]
-
-        self.removeRow(index.row())
+        self.removeRow(row)
 
     def get_date(self):
         """Get the date, as a QDate."""
@@ -487,14 +778,28 @@ class RaceTableModel(TableModel):
         self.set_race_property(self.DATE, date.toString(Qt.ISODate))
 
     def get_notes(self):
-        """Get the notes, as a QTextDocument."""
-        document = QTextDocument(self.get_race_property(self.NOTES))
-        document.setDocumentLayout(QPlainTextDocumentLayout(document))
-        return document
+        """Get the notes, as a QTextDocument.
+
+        If the notes haven't changed since the last time, the same document is returned.
+        """
+        text = self.get_race_property(self.NOTES)
+
+        if self.notes_document is None or text != self.notes_document_text:
+            self.notes_document = QTextDocument(text)
+            self.notes_document.setDocumentLayout(QPlainTextDocumentLayout(self.notes_document))
+            self.notes_document_text = text
+
+        return self.notes_document
 
     def set_notes(self, notes):
         """Set the notes, as a QTextDocument."""
-        self.set_race_property(self.NOTES, notes.toPlainText())
+        # Remember the document before setting the property, since that sends out dataChanged,
+        # and whoever is listening is likely going to ask for the notes right back.
+        text = notes.toPlainText()
+        self.notes_document = notes
+        self.notes_document_text = text
+
+        self.set_race_property(self.NOTES, text)
 
     def enable_reference_clock(self):
         """Enable reference clock."""
@@ -579,6 +884,10 @@ class FieldTableModel(TableModel):
     SUBFIELDS = 'subfields'
     METADATA = 'metadata'
 
+    HEADERS = ((NAME, 'Field'),
+               (SUBFIELDS, 'Subfields'),
+               (METADATA, 'Metadata'))
+
     def __init__(self, modeldb):
         """Initialize the FieldTableModel instance."""
         super().__init__(modeldb)
@@ -594,9 +903,7 @@ class FieldTableModel(TableModel):
         self.subfields_column = self.fieldIndex(self.SUBFIELDS)
         self.metadata_column = self.fieldIndex(self.METADATA)
 
-        self.setHeaderData(self.name_column, Qt.Horizontal, 'Field')
-        self.setHeaderData(self.subfields_column, Qt.Horizontal, 'Subfields')
-        self.setHeaderData(self.metadata_column, Qt.Horizontal, 'Metadata')
+        self.set_headers()
 
         self.select()
 
@@ -621,36 +928,18 @@ class FieldTableModel(TableModel):
 
     def name_from_id(self, field_id):
         """Get field name, from field ID."""
-        index_list = self.match(self.index(0, self.id_column),
-                                Qt.DisplayRole, field_id, 1, Qt.MatchExactly)
-
-        if not index_list:
-            return None
-
-        index = index_list[0]
-
-        return self.data(self.index(index.row(), self.name_column))
+        return self.lookup(self.id_column, field_id, self.name_column)
 
     def id_from_name(self, name):
         """Get field ID, from field name."""
-        index_list = self.match(self.index(0, self.name_column),
-                                Qt.DisplayRole, name, 1, Qt.MatchExactly)
-
-        if not index_list:
-            return None
-
-        index = index_list[0]
-
-        return self.data(self.index(index.row(), self.id_column))
+        return self.lookup(self.name_column, name, self.id_column)
 
     def add_field(self, name, subfields='', metadata=EMPTY_JSON):
         """Add a row to the database table."""
         if name == '':
             raise InputError('Field name "%s" is invalid' % name)
 
-        dup_field_index = self.match(self.index(0, self.name_column),
-                                     Qt.DisplayRole, name, 1, Qt.MatchExactly)
-        if dup_field_index:
+        if self.id_from_name(name) is not None:
             raise InputError('Field name "%s" is already being used.' % name)
 
         record = self.record()
@@ -663,36 +952,30 @@ class FieldTableModel(TableModel):
 
     def delete_field(self, name):
         """Delete a row from the database table."""
-        index_list = self.match(self.index(0, self.name_column),
-                                Qt.DisplayRole, name, 1, Qt.MatchExactly)
+        row = self.find_row(self.name_column, name)
 
-        if not index_list:
+        if row is None:
             raise InputError('Failed to find field with name %s' % name)
 
-        index = index_list[0]
-
-        self.removeRow(index.row())
+        self.removeRow(row)
 
     def get_field_metadata(self, name):
         """Returns the metadata of the field identified by "name"."""
-        index_list = self.match(self.index(0, self.name_column),
-                                Qt.DisplayRole, name, 1, Qt.MatchExactly)
+        metadata = self.lookup(self.name_column, name, self.metadata_column)
 
-        if not index_list:
+        if metadata is None:
             raise InputError('Failed to find field with name %s' % name)
 
-        record = self.record(index_list[0].row())
-        return record.value(self.METADATA)
+        return metadata
 
     def set_field_metadata(self, name, metadata):
         """Sets the metadata of the field identified by "name"."""
-        index_list = self.match(self.index(0, self.name_column),
-                                Qt.DisplayRole, name, 1, Qt.MatchExactly)
+        row = self.find_row(self.name_column, name)
 
-        if not index_list:
+        if row is None:
             raise InputError('Failed to find field with name %s' % name)
 
-        index = index_list[0].siblingAtColumn(self.metadata_column)
+        index = self.index(row, self.metadata_column)
         self.setData(index, metadata)
         self.dataChanged.emit(index, index)
 
@@ -702,15 +985,7 @@ class FieldTableModel(TableModel):
         This subfield is used for generating reports for fields that race together but are picked
         separately.
         """
-        index_list = self.match(self.index(0, self.name_column),
-                                Qt.DisplayRole, name, 1, Qt.MatchExactly)
-
-        if not index_list:
-            return None
-
-        index = index_list[0]
-
-        return self.data(self.index(index.row(), self.subfields_column))
+        return self.lookup(self.name_column, name, self.subfields_column)
 
     def data(self, index, role=Qt.DisplayRole):
         """Color-code the row according to whether no, some, or all racers have finished."""
@@ -724,9 +999,9 @@ class FieldTableModel(TableModel):
 
             if total != 0:
                 if finished == total:
-                    return QBrush(Qt.green)
+                    return GREEN_BRUSH
                 elif finished > 0:
-                    return QBrush(Qt.yellow)
+                    return YELLOW_BRUSH
 
         return super().data(index, role)
 
@@ -751,6 +1026,23 @@ class RacerTableModel(TableModel):
     STATUS = 'status'
     METADATA = 'metadata'
 
+    # With a remote connected, rows are painted according to their status.
+    STATUS_BRUSHES = {'local': YELLOW_BRUSH,
+                      'remote': GREEN_BRUSH,
+                      'rejected': RED_BRUSH}
+
+    HEADERS = ((BIB, 'Bib'),
+               (FIRST_NAME, 'First Name'),
+               (LAST_NAME, 'Last Name'),
+               (FIELD, 'Field'),
+               (CATEGORY, 'Cat'),
+               (TEAM, 'Team'),
+               (AGE, 'Age'),
+               (START, 'Start'),
+               (FINISH, 'Finish'),
+               (STATUS, 'Status'),
+               (METADATA, 'Metadata'))
+
     def __init__(self, modeldb):
         """Initialize the RacerTableModel instance."""
         super().__init__(modeldb)
@@ -776,17 +1068,7 @@ class RacerTableModel(TableModel):
         self.status_column = self.fieldIndex(self.STATUS)
         self.metadata_column = self.fieldIndex(self.METADATA)
 
-        self.setHeaderData(self.bib_column, Qt.Horizontal, 'Bib')
-        self.setHeaderData(self.first_name_column, Qt.Horizontal, 'First Name')
-        self.setHeaderData(self.last_name_column, Qt.Horizontal, 'Last Name')
-        self.setHeaderData(self.field_column, Qt.Horizontal, 'Field')
-        self.setHeaderData(self.category_column, Qt.Horizontal, 'Cat')
-        self.setHeaderData(self.team_column, Qt.Horizontal, 'Team')
-        self.setHeaderData(self.age_column, Qt.Horizontal, 'Age')
-        self.setHeaderData(self.start_column, Qt.Horizontal, 'Start')
-        self.setHeaderData(self.finish_column, Qt.Horizontal, 'Finish')
-        self.setHeaderData(self.status_column, Qt.Horizontal, 'Status')
-        self.setHeaderData(self.metadata_column, Qt.Horizontal, 'Metadata')
+        self.set_headers()
 
         # After this relation is defined, the field name becomes
         # "field_name_2" (FIELD_ALIAS).
@@ -794,6 +1076,31 @@ class RacerTableModel(TableModel):
                                                          FieldTableModel.ID,
                                                          FieldTableModel.NAME))
 
+        # For assign_start_times(), to count the start times that would get overwritten.
+        self.starts_set_query = self.prepare_query(
+            'SELECT COUNT(*) FROM "%s" WHERE "%s" != ?;' % (self.TABLE, self.START))
+        self.starts_set_in_field_query = self.prepare_query(
+            'SELECT COUNT(*) FROM "%s" WHERE "%s" != ? AND "%s" = ?;' % (self.TABLE, self.START,
+                                                                        self.FIELD))
+
+        # Per-field racer counts get asked for for every field row on every repaint, so count all
+        # of the fields in one query, and keep the counts until the racer or field table changes.
+        self.field_counts_query = self.prepare_query(
+            'SELECT "%s"."%s", COUNT(*), SUM("%s"."%s" != ?) ' % (FieldTableModel.TABLE,
+                                                                FieldTableModel.NAME,
+                                                                self.TABLE, self.FINISH) +
+            'FROM "%s" JOIN "%s" ' % (self.TABLE, FieldTableModel.TABLE) +
+            'ON "%s"."%s" = "%s"."%s" ' % (self.TABLE, self.FIELD,
+                                           FieldTableModel.TABLE, FieldTableModel.ID) +
+            'GROUP BY "%s"."%s";' % (self.TABLE, self.FIELD))
+        self.field_counts = None
+
+        for model in (self, self.modeldb.field_table_model):
+            model.dataChanged.connect(self.invalidate_field_counts)
+            model.rowsInserted.connect(self.invalidate_field_counts)
+            model.rowsRemoved.connect(self.invalidate_field_counts)
+            model.modelReset.connect(self.invalidate_field_counts)
+
         self.select()
 
     def create_table(self):
@@ -818,6 +1125,15 @@ class RacerTableModel(TableModel):
 
         query.finish()
 
+        # Racers get counted and looked up by field a lot. Having the finish time in here too means
+        # that the per-field total/finished counts can be done entirely from the index.
+        if not query.exec('CREATE INDEX IF NOT EXISTS "%s_%s_%s_index" ON "%s" ("%s", "%s");' %
+                          (self.TABLE, self.FIELD, self.FINISH,
+                           self.TABLE, self.FIELD, self.FINISH)):
+            raise DatabaseError(query.lastError().text())
+
+        query.finish()
+
     def add_racer(self, bib, first_name, last_name, field, category, team, age,
                   start=MSECS_UNINITIALIZED, finish=MSECS_UNINITIALIZED, status='',
                   metadata=EMPTY_JSON):
@@ -830,24 +1146,25 @@ class RacerTableModel(TableModel):
         Also, default QDateTime constructor makes an invalid time that ends up being stored as NULL
         in the table, which is what we want.
         """
-        dup_racer_index = self.match(self.index(0, self.bib_column),
-                                     Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-        if dup_racer_index:
-            dup_racer_first_name = dup_racer_index[0].siblingAtColumn(self.first_name_column).data()
-            dup_racer_last_name = dup_racer_index[0].siblingAtColumn(self.last_name_column).data()
+        bib = self.bib_from_input(bib)
+
+        dup_racer_row = self.row_from_bib(bib)
+        if dup_racer_row is not None:
+            dup_racer_record = self.record(dup_racer_row)
 
-            dup_racer_name = ' '.join([dup_racer_first_name, dup_racer_last_name])
+            dup_racer_name = ' '.join([dup_racer_record.value(self.FIRST_NAME),
+                                       dup_racer_record.value(self.LAST_NAME)])
 
             raise InputError('Racer bib "%s" is already being used by %s.' %
                              (bib, dup_racer_name))
 
         if first_name == '' and last_name == '':
-            raise InputError('Racer first and last name is .')
+            raise InputError('Racer first and last name are both missing.')
 
         # See if the field exists in our Field table.  If not, we add a new
         # field.
         if not field:
-            raise InputError('Racer field is missing.' % field)
+            raise InputError('Racer field is missing.')
 
         field_id = self.modeldb.field_table_model.id_from_name(field)
         if not field_id:
@@ -884,7 +1201,98 @@ class RacerTableModel(TableModel):
 
         self.insertRecord(-1, record)
 
-    def update_racer(self, bib, first_name, last_name, field, category, team, age, #pylint: disable=too-many-branches
+    def add_racers(self, racer_list):
+        """Add many rows to the database table at once.
+
+        racer_list is a list of (bib, first_name, last_name, field, category, team, age) tuples.
+        This does the same validation as add_racer(), but the rows are inserted with a single
+        prepared, batch-executed INSERT inside one transaction (along with any fields that need
+        to be added), and the model is only reselected once at the end.
+        This is what bulk imports should use.
+        """
+        # Validate everything up front, so that we don't leave a partial import behind. Bibs
+        # already in the table are checked through the bib map, and bibs within racer_list against
+        # each other.
+        new_bibs = {}
+
+        field_table_model = self.modeldb.field_table_model
+        field_id_dict = {}
+
+        for bib, first_name, last_name, field, _, _, _ in racer_list:
+            bib = self.bib_from_input(bib)
+
+            dup_racer_row = self.row_from_bib(bib)
+            if dup_racer_row is not None:
+                dup_racer_record = self.record(dup_racer_row)
+                raise InputError('Racer bib "%s" is already being used by %s.' %
+                                 (bib, ' '.join([dup_racer_record.value(self.FIRST_NAME),
+                                                 dup_racer_record.value(self.LAST_NAME)])))
+
+            if bib in new_bibs:
+                raise InputError('Racer bib "%s" is already being used by %s.' %
+                                 (bib, new_bibs[bib]))
+            new_bibs[bib] = ' '.join([first_name, last_name])
+
+            if first_name == '' and last_name == '':
+                raise InputError('Racer first and last name are both missing.')
+
+            if not field:
+                raise InputError('Racer field is missing.')
+
+            # See if the field exists in our Field table. Fields that don't get added below.
+            if field not in field_id_dict:
+                field_id_dict[field] = field_table_model.id_from_name(field)
+
+        if not racer_list:
+            return
+
+        query = self.prepare_query(
+            'INSERT INTO "%s" ' % self.TABLE +
+            '("%s", "%s", "%s", "%s", "%s", "%s", "%s", "%s", "%s", "%s", "%s") ' %
+            (self.BIB, self.FIRST_NAME, self.LAST_NAME, self.FIELD, self.CATEGORY, self.TEAM,
+             self.AGE, self.START, self.FINISH, self.STATUS, self.METADATA) +
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);')
+
+        # Bind each column as a list of values, and send the whole thing with execBatch().
+        # new_bibs holds the int bibs in racer_list order.
+        _, first_name_list, last_name_list, field_list, category_list, team_list, \
+            age_list = zip(*racer_list)
+        racer_count = len(racer_list)
+
+        # Don't wait for fsyncs while the import is being written. The import can simply be
+        # redone if we crash in the middle of it.
+        with self.modeldb.bulk(synchronous=False):
+            # New fields are added inside the transaction too, so that they get rolled back along
+            # with the racers if anything fails.
+            for field, field_id in field_id_dict.items():
+                if not field_id:
+                    field_table_model.add_field(field)
+                    field_id = field_table_model.id_from_name(field)
+
+                    if field_id is None:
+                        raise InputError('Racer field "%s" is invalid.' % field)
+
+                    field_id_dict[field] = field_id
+
+            query.addBindValue(list(new_bibs))
+            query.addBindValue(list(first_name_list))
+            query.addBindValue(list(last_name_list))
+            query.addBindValue([field_id_dict[field] for field in field_list])
+            query.addBindValue(list(category_list))
+            query.addBindValue(list(team_list))
+            query.addBindValue(list(age_list))
+            query.addBindValue([MSECS_UNINITIALIZED] * racer_count)
+            query.addBindValue([MSECS_UNINITIALIZED] * racer_count)
+            query.addBindValue([''] * racer_count)
+            query.addBindValue([EMPTY_JSON] * racer_count)
+
+            if not query.execBatch():
+                raise DatabaseError(query.lastError().text())
+            query.finish()
+
+        self.select()
+
+    def update_racer(self, bib, first_name, last_name, field, category, team, age,
                      start=MSECS_UNINITIALIZED, finish=MSECS_UNINITIALIZED, status='',
                      metadata=EMPTY_JSON):
         """Update a row in the racer database table.
@@ -896,18 +1304,17 @@ class RacerTableModel(TableModel):
         Also, default QDateTime constructor makes an invalid time that ends up being stored as NULL
         in the table, which is what we want.
         """
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-        if not index_list:
+        row = self.row_from_bib(bib)
+        if row is None:
             raise InputError('Racer bib %s not found.' % bib)
 
         if first_name == '' and last_name == '':
-            raise InputError('Racer first and last name is .')
+            raise InputError('Racer first and last name are both missing.')
 
         # See if the field exists in our Field table.  If not, we add a new
         # field.
         if not field:
-            raise InputError('Racer field is missing.' % field)
+            raise InputError('Racer field is missing.')
 
         field_id = self.modeldb.field_table_model.id_from_name(field)
         if not field_id:
@@ -917,135 +1324,110 @@ class RacerTableModel(TableModel):
         if field_id is None:
             raise InputError('Racer field "%s" is invalid.' % field)
 
-        record = self.record(index_list[0].row())
-
-        if record.value(self.FIRST_NAME) != first_name:
-            index = index_list[0].siblingAtColumn(self.first_name_column)
-            self.setData(index, first_name)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.LAST_NAME) != last_name:
-            index = index_list[0].siblingAtColumn(self.last_name_column)
-            self.setData(index, last_name)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.FIELD) != field_id:
-            index = index_list[0].siblingAtColumn(self.field_column)
-            self.setData(index, field_id)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.CATEGORY) != category:
-            index = index_list[0].siblingAtColumn(self.category_column)
-            self.setData(index, category)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.TEAM) != team:
-            index = index_list[0].siblingAtColumn(self.team_column)
-            self.setData(index, team)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.AGE) != age:
-            index = index_list[0].siblingAtColumn(self.age_column)
-            self.setData(index, age)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.START) != start:
-            index = index_list[0].siblingAtColumn(self.start_column)
-            self.setData(index, start)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.FINISH) != finish:
-            index = index_list[0].siblingAtColumn(self.finish_column)
-            self.setData(index, finish)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.STATUS) != status:
-            index = index_list[0].siblingAtColumn(self.status_column)
-            self.setData(index, status)
-            self.dataChanged.emit(index, index)
-
-        if record.value(self.METADATA) != metadata:
-            index = index_list[0].siblingAtColumn(self.metadata_column)
-            self.setData(index, metadata)
-            self.dataChanged.emit(index, index)
+        record = self.record(row)
+
+        # Work out what's changed, and send it all to the database in one go.
+        changes = [(column, value) for column, name, value in
+                   ((self.first_name_column, self.FIRST_NAME, first_name),
+                    (self.last_name_column, self.LAST_NAME, last_name),
+                    (self.field_column, self.FIELD, field_id),
+                    (self.category_column, self.CATEGORY, category),
+                    (self.team_column, self.TEAM, team),
+                    (self.age_column, self.AGE, age),
+                    (self.start_column, self.START, start),
+                    (self.finish_column, self.FINISH, finish),
+                    (self.status_column, self.STATUS, status),
+                    (self.metadata_column, self.METADATA, metadata))
+                   if record.value(name) != value]
+
+        self.set_cells(row, changes)
+
+    @staticmethod
+    def bib_key(bib):
+        """Return the bib the way it's stored in the table.
+
+        Bibs are INTEGER in the table, but often come in as strings (from the result scratch pad,
+        for example). Anything that isn't a number is left alone.
+        """
+        try:
+            return int(bib)
+        except (TypeError, ValueError):
+            return bib
+
+    @staticmethod
+    def bib_from_input(bib):
+        """Return a bib that's about to go into the table as an int.
+
+        Raises InputError if it isn't a number, rather than letting SQLite quietly store it as
+        text in the INTEGER column.
+        """
+        try:
+            return int(bib)
+        except (TypeError, ValueError):
+            raise InputError('Racer bib "%s" is not a number.' % bib) from None
+
+    def row_from_bib(self, bib):
+        """Return the model row of the racer identified by "bib", or None if there isn't one."""
+        return self.find_row(self.bib_column, self.bib_key(bib))
+
+    def existing_row_from_bib(self, bib):
+        """Return the model row of the racer identified by "bib", raising if there isn't one."""
+        row = self.row_from_bib(bib)
+
+        if row is None:
+            raise InputError('Failed to find racer with bib %s' % bib)
+
+        return row
 
     def delete_racer(self, bib):
         """Delete a row from the database table."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
+        row = self.row_from_bib(bib)
 
-        if not index_list:
+        if row is None:
             raise InputError('Failed to find racer with BIB %s' % bib)
 
-        index = index_list[0]
-
-        self.removeRow(index.row())
+        self.removeRow(row)
 
     def racer_exists(self, bib):
         """Returns True if racer exists, otherwise False."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-
-        return bool(index_list)
+        return self.row_from_bib(bib) is not None
 
     def get_racer_metadata(self, bib):
         """Returns the metadata of the racer identified by "bib"."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-
-        if not index_list:
-            raise InputError('Failed to find racer with bib %s' % bib)
-
-        record = self.record(index_list[0].row())
+        record = self.record(self.existing_row_from_bib(bib))
         return record.value(self.METADATA)
 
     def set_racer_metadata(self, bib, metadata):
-        """Returns the metadata of the racer identified by "bib"."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-
-        if not index_list:
-            raise InputError('Failed to find racer with bib %s' % bib)
+        """Sets the metadata of the racer identified by "bib"."""
+        self.set_racer_metadata_by_row(self.existing_row_from_bib(bib), metadata)
 
-        index = index_list[0].siblingAtColumn(self.metadata_column)
-        self.setData(index, metadata)
-        self.dataChanged.emit(index, index)
+    def set_racer_metadata_by_row(self, row, metadata):
+        """Sets the metadata of the racer in the given model row."""
+        self.set_cell(row, self.metadata_column, metadata)
 
     def set_racer_start(self, bib, start):
         """Set start time of the racer identified by "bib"."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-
-        if not index_list:
-            raise InputError('Failed to find racer with bib %s' % bib)
+        self.set_racer_start_by_row(self.existing_row_from_bib(bib), start)
 
-        index = index_list[0].siblingAtColumn(self.start_column)
-        self.setData(index, start)
-        self.dataChanged.emit(index, index)
+    def set_racer_start_by_row(self, row, start):
+        """Set start time of the racer in the given model row."""
+        self.set_cell(row, self.start_column, start)
 
     def set_racer_finish(self, bib, finish):
         """Set finish time of the racer identified by "bib"."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-
-        if not index_list:
-            raise InputError('Failed to find racer with bib %s' % bib)
+        self.set_racer_finish_by_row(self.existing_row_from_bib(bib), finish)
 
-        index = index_list[0].siblingAtColumn(self.finish_column)
-        self.setData(index, finish)
-        self.dataChanged.emit(index, index)
+    def set_racer_finish_by_row(self, row, finish):
+        """Set finish time of the racer in the given model row."""
+        self.set_cell(row, self.finish_column, finish)
 
     def set_racer_status(self, bib, status):
-        """Set finish time of the racer identified by "bib"."""
-        index_list = self.match(self.index(0, self.bib_column),
-                                Qt.DisplayRole, bib, 1, Qt.MatchExactly)
+        """Set status of the racer identified by "bib"."""
+        self.set_racer_status_by_row(self.existing_row_from_bib(bib), status)
 
-        if not index_list:
-            raise InputError('Failed to find racer with bib %s' % bib)
-
-        index = index_list[0].siblingAtColumn(self.status_column)
-        self.setData(index, status)
-        self.dataChanged.emit(index, index)
+    def set_racer_status_by_row(self, row, status):
+        """Set status of the racer in the given model row."""
+        self.set_cell(row, self.status_column, status)
 
     def assign_start_times(self, field_name, start, interval, dry_run=False):
         """Assign start times to racers.
@@ -1059,8 +1441,11 @@ class RacerTableModel(TableModel):
         If dry_run is true, then no action is taken, but we still return the number of racers
         whose start times would have been overwritten.
         """
-        if field_name and not self.modeldb.field_table_model.id_from_name(field_name):
-            raise InputError('Invalid field "%s"' % field_name)
+        field_id = None
+        if field_name:
+            field_id = self.modeldb.field_table_model.id_from_name(field_name)
+            if not field_id:
+                raise InputError('Invalid field "%s"' % field_name)
 
         if not isinstance(start, int):
             raise InputError('Invalid start data type "%s".' % type(start))
@@ -1068,24 +1453,37 @@ class RacerTableModel(TableModel):
         if not msecs_is_valid(start):
             raise InputError('Start time is in the past: msecs from reference is "%s".' % start)
 
-        starts_overwritten = 0
+        # Let the database count the start times that are already set, instead of walking every
+        # row through the model.
+        if field_id:
+            query = self.starts_set_in_field_query
+            query.bindValue(0, MSECS_UNINITIALIZED)
+            query.bindValue(1, field_id)
+        else:
+            query = self.starts_set_query
+            query.bindValue(0, MSECS_UNINITIALIZED)
 
-        for row in range(self.rowCount()):
-            if field_name:
-                field_index = self.index(row, self.field_column)
-                if not field_name == self.data(field_index):
-                    continue
+        if not query.exec():
+            raise DatabaseError(query.lastError().text())
 
-            start_index = self.index(row, self.start_column)
-            if not dry_run:
-                self.setData(start_index, start)
-            elif self.data(start_index) != MSECS_UNINITIALIZED:
-                starts_overwritten += 1
+        starts_overwritten = query.value(0) if query.next() else 0
+        query.finish()
+
+        if dry_run:
+            return starts_overwritten
+
+        with self.manual_submit():
+            for row in range(self.rowCount()):
+                if field_name:
+                    field_index = self.index(row, self.field_column)
+                    if not field_name == self.data(field_index):
+                        continue
 
-            start += interval * 1000 # Interval is in seconds.
+                self.setData(self.index(row, self.start_column), start)
 
-        if not dry_run:
-            self.dataChanged.emit(QModelIndex(), QModelIndex())
+                start += interval * 1000 # Interval is in seconds.
+
+        self.dataChanged.emit(QModelIndex(), QModelIndex())
 
         return starts_overwritten
 
@@ -1095,52 +1493,60 @@ class RacerTableModel(TableModel):
         if old_datetime == new_datetime:
             return
 
-        # Accumulate all of the changes and fire them off in one shot.
-        self.setEditStrategy(QSqlTableModel.OnManualSubmit)
-
         delta_msecs = old_datetime.msecsTo(new_datetime)
 
-        for row in range(self.rowCount()):
-            index = self.index(row, self.start_column)
-            if msecs_is_valid(self.data(index)):
-                self.setData(index, self.data(index) - delta_msecs)
+        # Shift every valid start and finish time (but leave the DNS/DNF/etc. special values alone)
+        # right in the database, and then reload the model.
+        query = QSqlQuery(self.database())
 
-            index = self.index(row, self.finish_column)
-            if msecs_is_valid(self.data(index)):
-                self.setData(index, self.data(index) - delta_msecs)
+        with self.modeldb.bulk():
+            for column_name in (self.START, self.FINISH):
+                if not query.prepare('UPDATE "%s" SET "%s" = "%s" - ? WHERE "%s" > ?;' %
+                                     (self.TABLE, column_name, column_name, column_name)):
+                    raise DatabaseError(query.lastError().text())
 
-        self.submitAll()
-        self.setEditStrategy(QSqlTableModel.OnFieldChange)
+                query.addBindValue(delta_msecs)
+                query.addBindValue(MSECS_SMALLEST_VALID)
+
+                if not query.exec():
+                    raise DatabaseError(query.lastError().text())
+
+                query.finish()
+
+        self.select()
 
     def racer_count(self):
         """Return total racers in the table."""
         return self.rowCount()
 
-    def racer_count_total_in_field(self, field_name):
-        """Return total racers in the table that belong to the specified field."""
-        count = 0
+    def invalidate_field_counts(self):
+        """Throw away the per-field racer counts, so that they get counted again when needed."""
+        self.field_counts = None
 
-        for row in range(self.rowCount()):
-            index = self.index(row, self.field_column)
+    def get_field_counts(self, field_name):
+        """Return (total racers, finished racers) in the specified field."""
+        if self.field_counts is None:
+            query = self.field_counts_query
+            query.bindValue(0, MSECS_UNINITIALIZED)
 
-            if self.data(index) == field_name:
-                count += 1
+            if not query.exec():
+                raise DatabaseError(query.lastError().text())
 
-        return count
+            self.field_counts = {}
+            while query.next():
+                self.field_counts[query.value(0)] = (query.value(1), query.value(2))
 
-    def racer_count_finished_in_field(self, field_name):
-        """Return total finished racers in the table that belong to the specified field."""
-        count = 0
+            query.finish()
 
-        for row in range(self.rowCount()):
-            field_index = self.index(row, self.field_column)
-            finish_index = self.index(row, self.finish_column)
+        return self.field_counts.get(field_name, (0, 0))
 
-            if (self.data(field_index) == field_name and
-                self.data(finish_index) != MSECS_UNINITIALIZED):
-                count += 1
+    def racer_count_total_in_field(self, field_name):
+        """Return total racers in the table that belong to the specified field."""
+        return self.get_field_counts(field_name)[0]
 
-        return count
+    def racer_count_finished_in_field(self, field_name):
+        """Return total finished racers in the table that belong to the specified field."""
+        return self.get_field_counts(field_name)[1]
 
     def set_remote(self, remote):
         """Do everything needed for a remote that has just been connected."""
@@ -1156,34 +1562,31 @@ class RacerTableModel(TableModel):
         has been submitted successfully to the remote.
         """
         if role == Qt.BackgroundRole:
-            brush = None
-
-            record = self.record(index.row())
-
-            column = index.column
-            start = record.value(self.START)
-            finish = record.value(self.FINISH)
-
-            # No start time. Paint the start time cell red.
-            if (column == self.start_column and start == MSECS_UNINITIALIZED):
-                brush = QBrush(Qt.red)
-
-            # Finish time is before the start time. Paint the finish time cell red.
-            elif (column == self.finish_column and msecs_is_valid(finish) and finish < start):
-                brush = QBrush(Qt.red)
+            # This gets called for every cell on every repaint, so only read the cells that are
+            # actually needed.
+            row = index.row()
+            column = index.column()
+
+            if column == self.start_column:
+                # No start time. Paint the start time cell red.
+                if super().data(index) == MSECS_UNINITIALIZED:
+                    return RED_BRUSH
+
+            elif column == self.finish_column:
+                # Finish time is before the start time. Paint the finish time cell red.
+                finish = super().data(index)
+                if (msecs_is_valid(finish) and
+                        finish < super().data(self.index(row, self.start_column))):
+                    return RED_BRUSH
 
             # If there is a remote, paint the row according to status.
-            elif self.remote:
-                if record.value(self.STATUS) == 'local':
-                    brush = QBrush(Qt.yellow)
-                elif record.value(self.STATUS) == 'remote':
-                    brush = QBrush(Qt.green)
-                elif record.value(self.STATUS) == 'rejected':
-                    brush = QBrush(Qt.red)
+            if self.remote:
+                brush = self.STATUS_BRUSHES.get(super().data(self.index(row, self.status_column)))
             # No remote. Paint according to whether there is a finish time.
+            elif super().data(self.index(row, self.finish_column)) != MSECS_UNINITIALIZED:
+                brush = GREEN_BRUSH
             else:
-                if finish != MSECS_UNINITIALIZED:
-                    brush = QBrush(Qt.green)
+                brush = None
 
             if brush:
                 return brush
@@ -1204,6 +1607,9 @@ class ResultTableModel(TableModel):
     SCRATCHPAD = 'scratchpad'
     FINISH = 'finish'
 
+    HEADERS = ((SCRATCHPAD, 'Bib'),
+               (FINISH, 'Finish'))
+
     def __init__(self, modeldb):
         """Initialize the ResultTableModel instance."""
         super().__init__(modeldb)
@@ -1218,8 +1624,11 @@ class ResultTableModel(TableModel):
         self.scratchpad_column = self.fieldIndex(self.SCRATCHPAD)
         self.finish_column = self.fieldIndex(self.FINISH)
 
-        self.setHeaderData(self.scratchpad_column, Qt.Horizontal, 'Bib')
-        self.setHeaderData(self.finish_column, Qt.Horizontal, 'Finish')
+        self.set_headers()
+
+        # Template record for add_result(), which gets called on every finish line press.
+        self.result_record = self.record()
+        self.result_record.setGenerated(self.ID, False)
 
         self.select()
 
@@ -1238,8 +1647,9 @@ class ResultTableModel(TableModel):
 
     def add_result(self, scratchpad, finish):
         """Add a row to the database table."""
-        record = self.record()
-        record.setGenerated(self.ID, False)
+        # Copying the template is cheap (QSqlRecord is implicitly shared), unlike asking the model
+        # for a fresh empty record every time.
+        record = QSqlRecord(self.result_record)
         record.setValue(self.SCRATCHPAD, scratchpad)
         record.setValue(self.FINISH, finish)
 
@@ -1251,6 +1661,12 @@ class ResultTableModel(TableModel):
         bib = record.value(self.SCRATCHPAD)
         finish = record.value(self.FINISH)
 
-        self.modeldb.racer_table_model.set_racer_finish(bib, finish)
-        self.modeldb.racer_table_model.set_racer_status(bib, 'local')
-        self.removeRow(row)
+        racer_table_model = self.modeldb.racer_table_model
+        racer_row = racer_table_model.existing_row_from_bib(bib)
+
+        # Set the finish time and status together, as one update, and remove the result in the
+        # same transaction, so that a result can't end up both submitted and still pending.
+        with self.modeldb.bulk():
+            racer_table_model.set_cells(racer_row, [(racer_table_model.finish_column, finish),
+                                                    (racer_table_model.status_column, 'local')])
+            self.removeRow(row)
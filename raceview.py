@@ -9,14 +9,14 @@ and the models.
 
 import os
 from PyQt5.QtCore import QEvent, QItemSelection, QModelIndex, QRegExp, QSettings, \
-                         QSortFilterProxyModel, Qt, pyqtSignal
+                         QSortFilterProxyModel, Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QDialog, QLabel, QMessageBox, QStyledItemDelegate, QTableView, \
                             QVBoxLayout
 import common
 import defaults
 from delegates import SqlRelationalDelegate
 from proxymodels import ExtraColumnsProxyModel, MSecsColumnsProxyModel
-from racemodel import InputError, FieldTableModel, Journal, ResultTableModel
+from racemodel import InputError, Journal
 from racemodel import msecs_is_valid, MSECS_UNINITIALIZED
 
 __copyright__ = '''
@@ -51,9 +51,66 @@ class ReadOnlyStyledItemDelegate(QStyledItemDelegate):
         del option
         del index
 
-class JournalTableView(QTableView):
+class ViewSettingsMixin:
+    """Mixin that saves and restores a table view's size, position, and header state.
+
+    Classes using this set DEFAULT_SIZE, and can override settings_group_name() if the class name
+    isn't a good enough QSettings group name.
+    """
+
+    DEFAULT_SIZE = None
+
+    def settings_group_name(self):
+        """Return the QSettings group that this view's settings live in."""
+        return self.__class__.__name__
+
+    def read_settings(self):
+        """Read settings."""
+        group_name = self.settings_group_name()
+        settings = QSettings()
+        settings.beginGroup(group_name)
+
+        self.resize(settings.value('size', self.DEFAULT_SIZE))
+        if settings.contains('pos'):
+            self.move(settings.value('pos'))
+
+        header_state = settings.value('horizontal_header_state')
+        if header_state is not None and not header_state.isEmpty():
+            self.horizontalHeader().restoreState(header_state)
+
+        settings.endGroup()
+
+        # Remember what was restored, so that write_settings() can skip writing it back unchanged.
+        self.saved_settings = (group_name, self.size(), self.pos(),
+                               self.horizontalHeader().saveState())
+
+    def write_settings(self):
+        """Write settings."""
+        group_name = self.settings_group_name()
+        size = self.size()
+        pos = self.pos()
+        header_state = self.horizontalHeader().saveState()
+
+        current_settings = (group_name, size, pos, header_state)
+        if current_settings == self.saved_settings:
+            return
+
+        settings = QSettings()
+        settings.beginGroup(group_name)
+
+        settings.setValue('size', size)
+        settings.setValue('pos', pos)
+        settings.setValue('horizontal_header_state', header_state)
+
+        settings.endGroup()
+
+        self.saved_settings = current_settings
+
+class JournalTableView(QTableView, ViewSettingsMixin):
     """Table view for the journal table model."""
 
+    DEFAULT_SIZE = defaults.JOURNAL_TABLE_VIEW_SIZE
+
     def __init__(self, modeldb, parent=None):
         """Initialize the JournalTableView instance."""
         super().__init__(parent=parent)
@@ -88,34 +145,6 @@ class JournalTableView(QTableView):
         self.write_settings()
         self.visibleChanged.emit(False)
 
-    def read_settings(self):
-        """Read settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        self.resize(settings.value('size', defaults.JOURNAL_TABLE_VIEW_SIZE))
-
-        if settings.contains('pos'):
-            self.move(settings.value('pos'))
-
-        if settings.contains('horizontal_header_state'):
-            self.horizontalHeader().restoreState(settings.value('horizontal_header_state'))
-
-        settings.endGroup()
-
-    def write_settings(self):
-        """Write settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        settings.setValue('size', self.size())
-        settings.setValue('pos', self.pos())
-        settings.setValue('horizontal_header_state', self.horizontalHeader().saveState())
-
-        settings.endGroup()
-
     # Signals.
     visibleChanged = pyqtSignal(bool)
 
@@ -146,10 +175,11 @@ class FieldProxyModel(ExtraColumnsProxyModel):
             field_table_model = self.sourceModel()
             racer_table_model = self.sourceModel().modeldb.racer_table_model
 
-            field_name = field_table_model.record(row).value(FieldTableModel.NAME)
+            # Just the name cell, rather than building the whole record for every cell painted.
+            field_name = field_table_model.data(field_table_model.index(
+                row, field_table_model.name_column))
 
-            total = racer_table_model.racer_count_total_in_field(field_name)
-            finished = racer_table_model.racer_count_finished_in_field(field_name)
+            total, finished = racer_table_model.get_field_counts(field_name)
 
             if extra_column == self.FINISHED_SECTION:
                 return finished
@@ -165,9 +195,11 @@ class FieldProxyModel(ExtraColumnsProxyModel):
 
         return None
 
-class FieldTableView(QTableView):
+class FieldTableView(QTableView, ViewSettingsMixin):
     """Table view for the field table model."""
 
+    DEFAULT_SIZE = defaults.FIELD_TABLE_VIEW_SIZE
+
     def __init__(self, modeldb, parent=None):
         """Initialize the FieldTableView instance."""
         super().__init__(parent=parent)
@@ -243,9 +275,9 @@ class FieldTableView(QTableView):
         racer_count = 0
         for selection in selection_list:
             field_record = field_table_model.record(selection.row())
-            field_id = field_record.value(FieldTableModel.ID)
+            field_name = field_record.value(field_table_model.name_column)
 
-            racer_count += racer_table_model.racer_count_total_in_field(field_id)
+            racer_count += racer_table_model.racer_count_total_in_field(field_name)
 
         # Confirm deletion.
         msg_box = QMessageBox()
@@ -268,7 +300,7 @@ class FieldTableView(QTableView):
         selection_list.sort(key=lambda selection: selection.row(), reverse=True)
         for selection in selection_list:
             field_record = field_table_model.record(selection.row())
-            field_id = field_record.value(FieldTableModel.ID)
+            field_id = field_record.value(field_table_model.id_column)
 
             racer_in_field_table_view = self.racer_in_field_table_view_dict[field_id]
             racer_in_field_table_model = racer_in_field_table_view.model()
@@ -311,7 +343,7 @@ class FieldTableView(QTableView):
 
         for row in range(field_table_model.rowCount()):
             record = field_table_model.record(row)
-            field_id = record.value(FieldTableModel.ID)
+            field_id = record.value(field_table_model.id_column)
             if field_id in self.racer_in_field_table_view_dict:
                 new_racer_table_view_dict[field_id] = self.racer_in_field_table_view_dict[field_id]
                 new_racer_table_view_dict[field_id].update_field_name()
@@ -336,7 +368,7 @@ class FieldTableView(QTableView):
             model_index.column() == field_table_model.subfields_column):
             return
 
-        field_id = field_table_model.record(model_index.row()).value(FieldTableModel.ID)
+        field_id = field_table_model.record(model_index.row()).value(field_table_model.id_column)
 
         self.racer_in_field_table_view_dict[field_id].show()
 
@@ -383,7 +415,7 @@ class FieldTableView(QTableView):
         """Call set_remote() for each of our racer-in-field table views."""
         self.remote = remote
 
-        for _, racer_in_field_table_view in self.racer_in_field_table_view_dict.items():
+        for racer_in_field_table_view in self.racer_in_field_table_view_dict.values():
             racer_in_field_table_view.set_remote(remote)
 
     def connect_preferences(self, preferences):
@@ -393,33 +425,6 @@ class FieldTableView(QTableView):
         for racer_table_view in self.racer_in_field_table_view_dict.values():
             racer_table_view.connect_preferences(preferences)
 
-    def read_settings(self):
-        """Read settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        self.resize(settings.value('size', defaults.FIELD_TABLE_VIEW_SIZE))
-        if settings.contains('pos'):
-            self.move(settings.value('pos'))
-
-        if settings.contains('horizontal_header_state'):
-            self.horizontalHeader().restoreState(settings.value('horizontal_header_state'))
-
-        settings.endGroup()
-
-    def write_settings(self):
-        """Write settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        settings.setValue('size', self.size())
-        settings.setValue('pos', self.pos())
-        settings.setValue('horizontal_header_state', self.horizontalHeader().saveState())
-
-        settings.endGroup()
-
     # Signals.
     visibleChanged = pyqtSignal(bool)
 
@@ -488,9 +493,11 @@ class RacerTableExtraColumnsProxyModel(ExtraColumnsProxyModel):
 
         return super().flags(index)
 
-class RacerTableView(QTableView):
+class RacerTableView(QTableView, ViewSettingsMixin):
     """Table view for the racer table model."""
 
+    DEFAULT_SIZE = defaults.RACER_TABLE_VIEW_SIZE
+
     def __init__(self, modeldb, field_id=None, parent=None):
         """Initialize the RacerTableView instance."""
         super().__init__(parent=parent)
@@ -633,45 +640,21 @@ class RacerTableView(QTableView):
         self.set_wall_times(preferences.wall_times_checkbox.isChecked())
         preferences.wall_times_checkbox.stateChanged.connect(self.proxy_model_msecs.set_wall_times)
 
-    def read_settings(self):
-        """Read settings."""
+    def settings_group_name(self):
+        """Racer table views for a particular field get their own settings group."""
         group_name = self.__class__.__name__
         if self.field_id:
             field_name = self.modeldb.field_table_model.name_from_id(self.field_id)
             group_name = '_'.join([group_name, field_name])
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        self.resize(settings.value('size', defaults.RACER_TABLE_VIEW_SIZE))
-        if settings.contains('pos'):
-            self.move(settings.value('pos'))
-
-        if settings.contains('horizontal_header_state'):
-            self.horizontalHeader().restoreState(settings.value('horizontal_header_state'))
-
-        settings.endGroup()
-
-    def write_settings(self):
-        """Write settings."""
-        group_name = self.__class__.__name__
-        if self.field_id:
-            field_name = self.modeldb.field_table_model.name_from_id(self.field_id)
-            group_name = '_'.join([group_name, field_name])
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        settings.setValue('size', self.size())
-        settings.setValue('pos', self.pos())
-        settings.setValue('horizontal_header_state', self.horizontalHeader().saveState())
-
-        settings.endGroup()
+        return group_name
 
     # Signals.
     visibleChanged = pyqtSignal(bool)
 
-class ResultTableView(QTableView):
+class ResultTableView(QTableView, ViewSettingsMixin):
     """Table view for the result table model."""
 
+    DEFAULT_SIZE = defaults.RESULT_TABLE_VIEW_SIZE
     RESULT_TABLE_POINT_SIZE = 20
 
     def __init__(self, modeldb, parent=None):
@@ -700,6 +683,13 @@ class ResultTableView(QTableView):
         self.verticalHeader().setVisible(False)
         self.hideColumn(self.source_model.id_column)
 
+        # Results can come in faster than we repaint, so scroll to the latest one after the event
+        # loop has caught up, instead of once per result.
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(0)
+        self.scroll_timer.timeout.connect(self.scroll_to_last_result)
+
         self.setup_tooltip()
 
         font = self.font()
@@ -721,6 +711,18 @@ class ResultTableView(QTableView):
         self.write_settings()
         self.visibleChanged.emit(False)
 
+    def scroll_to_last_result(self):
+        """Scroll so that the last result (normally the one just entered) is in view.
+
+        This scrolls to that row only, rather than using scrollToBottom(), which also makes the
+        view fetch any rows the model hasn't loaded yet.
+        """
+        model = self.model()
+        row_count = model.rowCount()
+        if row_count:
+            self.scrollTo(model.index(row_count - 1, self.source_model.scratchpad_column),
+                          QTableView.PositionAtBottom)
+
     def eventFilter(self, watched, event): #pylint: disable=invalid-name
         """Event filter for showing/hiding a tool tip."""
         if self.viewport() == watched:
@@ -781,13 +783,11 @@ class ResultTableView(QTableView):
             text = 'Invalid bib number'
         else:
             racer_table_model = self.modeldb.racer_table_model
-            racer_bib_column = racer_table_model.bib_column
-            racer_index_list = racer_table_model.match(racer_table_model.index(0, racer_bib_column),
-                                                       Qt.DisplayRole, bib, 1, Qt.MatchExactly)
-            if not racer_index_list:
+            racer_row = racer_table_model.row_from_bib(bib)
+            if racer_row is None:
                 text = 'Unknown bib number'
             else:
-                racer_index = racer_index_list[0]
+                racer_index = racer_table_model.index(racer_row, racer_table_model.bib_column)
                 racer_first_name_column = racer_table_model.first_name_column
                 racer_first_name_index = racer_index.siblingAtColumn(racer_first_name_column)
                 racer_first_name = racer_first_name_index.data(Qt.DisplayRole)
@@ -822,17 +822,21 @@ class ResultTableView(QTableView):
         # immediately, and cause the rest of the rows to shift, invalidating
         # any row number that's higher than the currently removed one.
         selection_list.sort(key=lambda selection: selection.row(), reverse=True)
-        for selection in selection_list:
-            record = self.source_model.record(selection.row())
 
+        # Delete the whole selection in one transaction, instead of one per row.
+        with self.modeldb.bulk():
             reference_datetime = race_table_model.get_reference_clock_datetime()
-            bib = record.value(ResultTableModel.SCRATCHPAD)
-            msecs = record.value(ResultTableModel.FINISH)
-            finish = reference_datetime.addMSecs(msecs).toString(defaults.DATETIME_FORMAT)
 
-            self.journal.log('Result with bib "%s" and time "%s" deleted.' % (bib, finish))
+            for selection in selection_list:
+                record = self.source_model.record(selection.row())
+
+                bib = record.value(self.source_model.scratchpad_column)
+                msecs = record.value(self.source_model.finish_column)
+                finish = reference_datetime.addMSecs(msecs).toString(defaults.DATETIME_FORMAT)
 
-            self.source_model.removeRow(selection.row())
+                self.journal.log('Result with bib "%s" and time "%s" deleted.' % (bib, finish))
+
+                self.source_model.removeRow(selection.row())
 
         # Model retains blank rows until we select() again.
         self.modeldb.result_table_model.select()
@@ -866,27 +870,39 @@ class ResultTableView(QTableView):
         # any row number that's higher than the currently removed one.
         selection_list.sort(key=lambda selection: selection.row(), reverse=True)
         deleted_selection = QItemSelection()
-        for selection in selection_list:
-            try:
-                # Only try to submit it if it's a non-negative integer.
-                # Else, it is obviously a work in progress, so don't even
-                # bother.
-                record = self.source_model.record(selection.row())
-                scratchpad = record.value(ResultTableModel.SCRATCHPAD)
-                if scratchpad.isdigit():
-                    self.source_model.submit_result(selection.row())
-                    deleted_selection.select(selection, selection)
 
-                    reference_datetime = race_table_model.get_reference_clock_datetime()
-                    bib = record.value(ResultTableModel.SCRATCHPAD)
-                    msecs = record.value(ResultTableModel.FINISH)
-                    finish = reference_datetime.addMSecs(msecs).toString(defaults.DATETIME_FORMAT)
+        # Submit the whole selection in one transaction, instead of one per row. A result that
+        # fails to submit only skips that result; it doesn't roll back the others. Its error gets
+        # shown after the transaction is done, rather than holding the transaction open for as
+        # long as a message box is up.
+        error_list = []
+        with self.modeldb.bulk():
+            reference_datetime = race_table_model.get_reference_clock_datetime()
 
-                    self.journal.log('Result with bib "%s" and time "%s" submitted.' %
-                                     (bib, finish))
+            for selection in selection_list:
+                try:
+                    # Only try to submit it if it's a non-negative integer.
+                    # Else, it is obviously a work in progress, so don't even
+                    # bother.
+                    record = self.source_model.record(selection.row())
+                    scratchpad = record.value(self.source_model.scratchpad_column)
+                    if scratchpad.isdigit():
+                        self.source_model.submit_result(selection.row())
+                        deleted_selection.select(selection, selection)
 
-            except InputError as e:
-                QMessageBox.warning(self, 'Error', str(e))
+                        bib = scratchpad
+                        msecs = record.value(self.source_model.finish_column)
+                        finish = reference_datetime.addMSecs(msecs).toString(
+                            defaults.DATETIME_FORMAT)
+
+                        self.journal.log('Result with bib "%s" and time "%s" submitted.' %
+                                         (bib, finish))
+
+                except InputError as e:
+                    error_list.append(str(e))
+
+        for error in error_list:
+            QMessageBox.warning(self, 'Error', error)
 
         # Model retains blank rows until we select() again.
         self.source_model.select()
@@ -910,33 +926,6 @@ class ResultTableView(QTableView):
         self.set_wall_times(preferences.wall_times_checkbox.isChecked())
         preferences.wall_times_checkbox.stateChanged.connect(self.proxy_model.set_wall_times)
 
-    def read_settings(self):
-        """Read settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        self.resize(settings.value('size', defaults.RESULT_TABLE_VIEW_SIZE))
-        if settings.contains('pos'):
-            self.move(settings.value('pos'))
-
-        if settings.contains('horizontal_header_state'):
-            self.horizontalHeader().restoreState(settings.value('horizontal_header_state'))
-
-        settings.endGroup()
-
-    def write_settings(self):
-        """Write settings."""
-        group_name = self.__class__.__name__
-        settings = QSettings()
-        settings.beginGroup(group_name)
-
-        settings.setValue('size', self.size())
-        settings.setValue('pos', self.pos())
-        settings.setValue('horizontal_header_state', self.horizontalHeader().saveState())
-
-        settings.endGroup()
-
     # Signals.
     visibleChanged = pyqtSignal(bool)
     clicked_without_selection = pyqtSignal()
@@ -505,6 +505,22 @@ class OnTheDayRemote(Remote):
                 else:
                     self.pending_queue.append(result)
 
+    def add_racer_from_change(self, ontheday_change, ontheday_entry):
+        """Add (or update) a racer from a remote change.
+
+        An entry we can't take (say, with a missing or non-numeric race number) just gets noted in
+        the journal, so that it doesn't stop the rest of the changes from being processed.
+        """
+        try:
+            ontheday.add_racer_to_modeldb(self.modeldb, ontheday_entry,
+                                          ontheday_change['category_name'],
+                                          ontheday_change['category_start'])
+        except InputError as e:
+            self.journal.log('Skipped racer "%s %s" in field "%s": %s' %
+                             (ontheday_entry.get('firstname', ''),
+                              ontheday_entry.get('lastname', ''),
+                              ontheday_change['category_name'], e))
+
     def process_remote_changes(self):
         """Update our views with a list of remote changes.
 
@@ -529,9 +545,7 @@ class OnTheDayRemote(Remote):
                 try:
                     racer_metadata = json.loads(racer_table_model.get_racer_metadata(bib))
                 except InputError:
-                    ontheday.add_racer_to_modeldb(self.modeldb, ontheday_entry,
-                                                  ontheday_change['category_name'],
-                                                  ontheday_change['category_start'])
+                    self.add_racer_from_change(ontheday_change, ontheday_entry)
                     continue
 
                 if (('checksum' in racer_metadata['ontheday']) and
@@ -541,9 +555,7 @@ class OnTheDayRemote(Remote):
                 racer_metadata['ontheday']['checksum'] = ontheday_entry['checksum']
 
                 # Adding an already existing racer will just update its entry.
-                ontheday.add_racer_to_modeldb(self.modeldb, ontheday_entry,
-                                              ontheday_change['category_name'],
-                                              ontheday_change['category_start'])
+                self.add_racer_from_change(ontheday_change, ontheday_entry)
 
             field_metadata = json.loads(
                 field_table_model.get_field_metadata(ontheday_change['category_name']))
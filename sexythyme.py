@@ -5,13 +5,10 @@
 This is the execution entry point for the app.
 """
 
-import argparse
 import os
+import platform
 import sys
-import traceback
-from PyQt5.QtWidgets import QApplication, QMessageBox
 import common
-from gui import SexyThymeMainWindow
 
 __copyright__ = '''
     Copyright (C) 2018-2019 Andrew Chew
@@ -42,7 +39,21 @@ def excepthook(exc_type, exc_value, exc_traceback):
 
     Also, call the old except hook to get the normal behavior as well.
     """
-    exception_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+
+    # Without a QApplication there is no way to show a dialog (Qt would just abort), so only do
+    # the normal printout.
+    if QApplication.instance() is None:
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+
+    import io
+    import traceback
+
+    # Print straight into a single buffer rather than joining a list of formatted lines.
+    exception_buffer = io.StringIO()
+    traceback.print_exception(exc_type, exc_value, exc_traceback, file=exception_buffer)
+    exception_str = exception_buffer.getvalue()
     QMessageBox.critical(None, exc_type.__name__,
                          'Unhandled exception (please send to %s)!\n\n%s' % (common.EMAIL,
                                                                              exception_str))
@@ -50,25 +61,55 @@ def excepthook(exc_type, exc_value, exc_traceback):
     sys.excepthook = sys.__excepthook__
     sys.excepthook(exc_type, exc_value, exc_traceback)
 
-# Install our custom exception hook.
-sys.excepthook = excepthook
-
 def main():
-    """The main() function creates the main window and starts the event loop."""
+    """The main() function creates the main window and starts the event loop.
+
+    The GUI modules are imported here, after argument parsing, so that things like --version and
+    --help don't pay for loading the whole app.
+    """
+    version_string = common.APPLICATION_NAME + ' v' + common.VERSION
+
+    # Fast path for --version, which the build queries just to get the version string.
+    if sys.argv[1:] == ['--version']:
+        print(version_string)
+        sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description=common.APPLICATION_NAME)
     parser.add_argument('--version', action='version',
-                        version=common.APPLICATION_NAME + ' v' + common.VERSION)
+                        version=version_string)
     parser.add_argument('racefile', nargs='?',
                         help='Optional racefile to load')
     args = parser.parse_args()
 
+    from PyQt5.QtCore import QSettings, Qt
+    from PyQt5.QtWidgets import QApplication
+    from gui import SexyThymeMainWindow
+
     QApplication.setOrganizationName(common.ORGANIZATION_NAME)
     QApplication.setOrganizationDomain(common.ORGANIZATION_DOMAIN)
     QApplication.setApplicationName(common.APPLICATION_NAME)
     QApplication.setApplicationVersion(common.VERSION)
 
+    # On Windows, the native QSettings format is the registry, which is comparatively slow to read
+    # and write. Use an ini file instead.
+    if platform.system() == 'Windows':
+        QSettings.setDefaultFormat(QSettings.IniFormat)
+
+    # These attributes must be set before the QApplication is constructed. The floating table views
+    # and clock don't need native sibling windows, and compressing high frequency events keeps
+    # resizes and scrolling of the table views from queuing up redundant repaints.
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+
     app = QApplication(sys.argv)
 
+    # Install our custom exception hook. This has to wait until the QApplication exists, because
+    # the hook shows a dialog. Anything that goes wrong before this point (such as a failed import)
+    # gets the normal traceback printout.
+    sys.excepthook = excepthook
+
     # Set our current working directory to the documents folder. We need to do this because running
     # a pyinstaller version of this app has the current working directory as "/" (at least, on OS X)
     # which is always wrong. Therefore, always just start it off at somewhere sane and writable.